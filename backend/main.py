@@ -22,11 +22,19 @@ async def lifespan(app: FastAPI):
     # Startup: Load models
     print("Loading models...")
     from models.decision_tree import get_trained_model
-    from models.xgboost_model import load_xgboost_model
+    from models.xgboost_model import (
+        load_xgboost_model,
+        get_global_feature_importance,
+        get_preset_shap_explanations
+    )
 
     # Models are loaded via module-level cache, just trigger loading
     get_trained_model()
     load_xgboost_model()
+    # Global SHAP sample and the importance ranking built from it
+    get_global_feature_importance()
+    # Precompute SHAP explanations for the preset passengers
+    get_preset_shap_explanations()
     print("Models loaded successfully!")
 
     yield
@@ -68,6 +76,21 @@ app.include_router(predict.router, prefix="/api", tags=["predictions"])
 app.include_router(tree.router, prefix="/api", tags=["tree"])
 
 
+class ImmutableStaticFiles(StaticFiles):
+    """
+    Static files served with long-lived cache headers.
+
+    Vite content-hashes every file in assets/ (including the d3 vendor chunk),
+    so browsers can keep them until the hash changes.
+    """
+
+    async def get_response(self, path, scope):
+        response = await super().get_response(path, scope)
+        if response.status_code == 200:
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
+
 # Determine static files path (production vs development)
 # In production (Docker), frontend build is copied to /app/static
 # In development, it's at ../frontend/dist
@@ -75,7 +98,7 @@ STATIC_DIR = Path("/app/static") if Path("/app/static").exists() else Path(__fil
 
 # Mount static files (only if build exists)
 if STATIC_DIR.exists():
-    app.mount("/assets", StaticFiles(directory=STATIC_DIR / "assets"), name="assets")
+    app.mount("/assets", ImmutableStaticFiles(directory=STATIC_DIR / "assets"), name="assets")
 
     # Serve index.html for root and all non-API routes (SPA routing)
     @app.get("/{full_path:path}")
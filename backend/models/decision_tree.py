@@ -263,25 +263,22 @@ def predict_single(
     tree_data = get_trained_model()
     model = tree_data['model']
 
-    # Create input dataframe
-    input_data = pd.DataFrame([{
-        'sex': sex,
-        'pclass': pclass,
-        'age': age,
-        'fare': fare
-    }])
-
-    # Get prediction and probability
-    prediction = model.predict(input_data)[0]
-    probabilities = model.predict_proba(input_data)[0]
-
-    # Get decision path
-    decision_path = model.decision_path(input_data)
-    leaf_id = model.apply(input_data)[0]
-
-    # Get path through tree
-    node_indicator = decision_path.toarray()[0]
-    path_nodes = [i for i, v in enumerate(node_indicator) if v == 1]
+    # Query the fitted tree arrays directly: for one row, building a DataFrame
+    # and validating it in four estimator calls costs more than the traversal
+    passenger = {'sex': sex, 'pclass': pclass, 'age': age, 'fare': fare}
+    input_array = np.array(
+        [[passenger[feat] for feat in tree_data['feature_names']]],
+        dtype=np.float32
+    )
+
+    # Get decision path and the leaf it ends in
+    path_nodes = sorted(model.tree_.decision_path(input_array).indices.tolist())
+    leaf_id = model.tree_.apply(input_array)[0]
+
+    # Leaf class distribution (counts or fractions depending on sklearn version)
+    leaf_values = model.tree_.value[leaf_id][0]
+    probabilities = leaf_values / leaf_values.sum()
+    prediction = model.classes_[np.argmax(probabilities)]
 
     return {
         'prediction': int(prediction),
@@ -3,15 +3,30 @@ XGBoost Model Module
 Handles loading, training, and SHAP explanations for the XGBoost model.
 """
 
-import pandas as pd
 import numpy as np
 from functools import lru_cache
 import shap
 from xgboost import XGBClassifier
+from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score
 
 from .decision_tree import get_trained_model
 
 
+# Waterfall values are displayed with at most 3 decimals; rounding the
+# payload to 4 keeps responses small without visible precision loss
+WATERFALL_DECIMALS = 4
+
+# Passengers the UI requests without any typed input: App.jsx's default
+# passenger and what ChatPanel.jsx's suggestion chips parse to (via
+# cohortPatterns.js). Update these if the chips or the default change
+PRESET_PASSENGERS = (
+    (0, 1, 8.0, 84.0),   # Initial view: 8-year-old girl in 1st class
+    (0, 2, 30.0, 20.0),  # "Compare women vs men": women
+    (1, 2, 30.0, 20.0),  # "Compare women vs men": men
+    (1, 1, 30.0, 84.0),  # "1st class male passenger"
+    (0, 3, 8.0, 13.0),   # "Children in 3rd class"
+)
+
 @lru_cache(maxsize=1)
 def load_xgboost_model():
     """
@@ -19,7 +34,7 @@ def load_xgboost_model():
     Uses LRU cache to ensure model is only loaded once.
 
     Returns:
-        dict: Contains model, explainer, and training data
+        dict: Contains model, explainer, training data, and feature names
     """
     # Get training data from decision tree module (uses same train/test split)
     tree_data = get_trained_model()
@@ -41,11 +56,6 @@ def load_xgboost_model():
     # Create SHAP explainer
     explainer = shap.TreeExplainer(xgb_model)
 
-    # Compute SHAP values for a sample (for global importance)
-    sample_size = min(200, len(X_test))
-    X_sample = X_test.sample(sample_size, random_state=42)
-    shap_values = explainer.shap_values(X_sample)
-
     return {
         'model': xgb_model,
         'explainer': explainer,
@@ -53,8 +63,40 @@ def load_xgboost_model():
         'y_train': y_train,
         'X_test': X_test,
         'y_test': y_test,
+        'feature_names': X_train.columns.tolist()
+    }
+
+
+@lru_cache(maxsize=1)
+def get_global_shap_values(sample_size: int = 200, random_state: int = 42):
+    """
+    Compute and cache SHAP values for a test-set sample (for global importance).
+
+    Kept separate from load_xgboost_model so predictions and per-passenger
+    explanations don't pay for the sample SHAP pass, and the sample can be
+    recomputed without retraining the model.
+
+    Args:
+        sample_size: Maximum number of test rows to explain (default: 200)
+        random_state: Seed for sampling the test set (default: 42)
+
+    Returns:
+        dict: Contains X_sample, shap_values, mean_shap_values, feature_names
+    """
+    model_data = load_xgboost_model()
+    explainer = model_data['explainer']
+    X_test = model_data['X_test']
+
+    X_sample = X_test.sample(min(sample_size, len(X_test)), random_state=random_state)
+    shap_values = explainer.shap_values(X_sample)
+
+    # Global importance inputs never change for a given sample,
+    # so compute them once alongside the cached SHAP matrix
+    return {
         'X_sample': X_sample,
-        'shap_values': shap_values
+        'shap_values': shap_values,
+        'mean_shap_values': np.abs(shap_values).mean(axis=0),
+        'feature_names': X_sample.columns.tolist()
     }
 
 
@@ -71,26 +113,88 @@ def predict_xgboost(sex: int, pclass: int, age: float, fare: float):
     Returns:
         dict: Prediction result with probability
     """
+    probability_died, probability_survived = _get_passenger_probabilities(sex, pclass, age, fare)
+
+    # Same rule XGBClassifier.predict applies to binary probabilities
+    prediction = int(probability_survived > 0.5)
+
+    return {
+        'prediction': prediction,
+        'probability_survived': probability_survived,
+        'probability_died': probability_died,
+        'prediction_label': 'Survived' if prediction == 1 else 'Died'
+    }
+
+
+@lru_cache(maxsize=1024)
+def _get_passenger_probabilities(sex: int, pclass: int, age: float, fare: float):
+    """
+    Compute class probabilities for a single passenger, cached per input tuple.
+
+    Every passenger change asks /predict/both for the same few inputs the
+    chat cards and presets already requested, so repeats skip the model.
+
+    Returns:
+        tuple: (probability_died, probability_survived) as floats
+    """
     model_data = load_xgboost_model()
     model = model_data['model']
 
-    # Create input dataframe
-    input_data = pd.DataFrame([{
-        'sex': sex,
-        'pclass': pclass,
-        'age': age,
-        'fare': fare
-    }])
+    passenger = {'sex': sex, 'pclass': pclass, 'age': age, 'fare': fare}
+    input_array = np.array(
+        [[passenger[feat] for feat in model_data['feature_names']]],
+        dtype=np.float32
+    )
+
+    # One predict_proba pass; the label is derived from it in predict_xgboost
+    probabilities = model.predict_proba(input_array)[0]
+    return float(probabilities[0]), float(probabilities[1])
+
+
+def _get_passenger_shap_values(sex: int, pclass: int, age: float, fare: float):
+    """
+    Compute SHAP values for a single passenger.
+
+    Returns:
+        np.ndarray: SHAP values in feature order
+    """
+    model_data = load_xgboost_model()
+    explainer = model_data['explainer']
+
+    # Plain 2D array in the model's feature order; skips building a
+    # one-row DataFrame on every call
+    passenger = {'sex': sex, 'pclass': pclass, 'age': age, 'fare': fare}
+    input_array = np.array(
+        [[passenger[feat] for feat in model_data['feature_names']]],
+        dtype=np.float32
+    )
+
+    # The additivity check re-runs the model just to verify the SHAP sum;
+    # TreeExplainer's exact values don't need it on the request path
+    return explainer.shap_values(input_array, check_additivity=False)[0]
+
+
+@lru_cache(maxsize=1)
+def get_preset_shap_explanations():
+    """
+    Precompute SHAP explanations for the preset passengers.
+
+    Called at startup so preset clicks are served as a dict lookup
+    instead of a SHAP pass and waterfall build.
+
+    Returns:
+        dict: Maps (sex, pclass, age, fare) tuples to SHAP explanations
+    """
+    explainer = load_xgboost_model()['explainer']
 
-    # Get prediction and probability
-    prediction = model.predict(input_data)[0]
-    probabilities = model.predict_proba(input_data)[0]
+    # One batched TreeExplainer call for all presets instead of one per row
+    # (PRESET_PASSENGERS rows are already in sex, pclass, age, fare order)
+    preset_array = np.array(PRESET_PASSENGERS, dtype=np.float32)
+    preset_shap_values = explainer.shap_values(preset_array, check_additivity=False)
 
     return {
-        'prediction': int(prediction),
-        'probability_survived': float(probabilities[1]),
-        'probability_died': float(probabilities[0]),
-        'prediction_label': 'Survived' if prediction == 1 else 'Died'
+        values: _build_shap_explanation(*values, shap_values_individual=shap_row)
+        for values, shap_row in zip(PRESET_PASSENGERS, preset_shap_values)
     }
 
 
@@ -98,11 +202,55 @@ def get_shap_explanation(sex: int, pclass: int, age: float, fare: float):
     """
     Get SHAP explanation for a specific prediction.
 
+    Preset passengers are served from the precomputed explanations.
+
+    Args:
+        sex: Gender (0=female, 1=male)
+        pclass: Passenger class (1, 2, or 3)
+        age: Age in years
+        fare: Ticket fare in pounds
+
+    Returns:
+        dict: SHAP values and explanation data
+    """
+    preset = get_preset_shap_explanations().get((sex, pclass, age, fare))
+    if preset is not None:
+        return preset
+
+    return _get_passenger_shap_explanation(sex, pclass, age, fare)
+
+
+@lru_cache(maxsize=1024)
+def _get_passenger_shap_explanation(sex: int, pclass: int, age: float, fare: float):
+    """
+    Build the SHAP explanation for a single passenger, cached per input tuple.
+
+    Inputs are four bounded fields, so chat replays and cohort comparisons
+    keep asking for the same passengers. Caching the finished explanation
+    skips both the TreeExplainer pass and the waterfall sort for repeats.
+
+    Returns:
+        dict: SHAP values and explanation data (shared, do not mutate)
+    """
+    return _build_shap_explanation(sex, pclass, age, fare)
+
+
+def _build_shap_explanation(
+    sex: int,
+    pclass: int,
+    age: float,
+    fare: float,
+    shap_values_individual: np.ndarray = None
+):
+    """
+    Build the SHAP explanation and waterfall data for a passenger.
+
     Args:
         sex: Gender (0=female, 1=male)
         pclass: Passenger class (1, 2, or 3)
         age: Age in years
         fare: Ticket fare in pounds
+        shap_values_individual: Precomputed SHAP values (computed if None)
 
     Returns:
         dict: SHAP values and explanation data
@@ -110,16 +258,9 @@ def get_shap_explanation(sex: int, pclass: int, age: float, fare: float):
     model_data = load_xgboost_model()
     explainer = model_data['explainer']
 
-    # Create input dataframe
-    input_data = pd.DataFrame([{
-        'sex': sex,
-        'pclass': pclass,
-        'age': age,
-        'fare': fare
-    }])
-
-    # Get SHAP values
-    shap_values_individual = explainer.shap_values(input_data)[0]
+    # Get SHAP values unless already computed
+    if shap_values_individual is None:
+        shap_values_individual = _get_passenger_shap_values(sex, pclass, age, fare)
     expected_val = explainer.expected_value
 
     # Handle different SHAP explainer types (array or scalar)
@@ -131,68 +272,73 @@ def get_shap_explanation(sex: int, pclass: int, age: float, fare: float):
     final_prediction = float(base_value + np.sum(shap_values_individual))
 
     # Prepare waterfall data
-    feature_names = input_data.columns.tolist()
-    waterfall_data = []
-    cumulative = base_value
-
-    # Add base value as first item (for visualization)
-    waterfall_data.append({
+    feature_names = model_data['feature_names']
+    passenger = {'sex': sex, 'pclass': pclass, 'age': age, 'fare': fare}
+    feature_values = [passenger[feat] for feat in feature_names]
+
+    # Cumulative start/end of each contribution, in feature order
+    ends = base_value + np.cumsum(shap_values_individual)
+    starts = np.concatenate(([base_value], ends[:-1]))
+
+    # Base value goes first (for visualization), then features sorted by
+    # absolute SHAP value. argsort indexes the parallel arrays directly;
+    # 'stable' keeps ties in feature order, matching sorted()
+    order = np.argsort(-np.abs(shap_values_individual), kind='stable').tolist()
+
+    # Convert to Python floats in one C-level pass per array instead of a
+    # float() call per element
+    values = shap_values_individual.tolist()
+    starts = starts.tolist()
+    ends = ends.tolist()
+
+    waterfall_data_sorted = [{
         "feature": "Base",
         "value": 0.0,  # Base has no contribution itself
-        "start": float(base_value),
-        "end": float(base_value),
+        "start": round(float(base_value), WATERFALL_DECIMALS),
+        "end": round(float(base_value), WATERFALL_DECIMALS),
         "feature_value": ""
-    })
-
-    for feat, shap_val, feat_val in zip(feature_names, shap_values_individual, input_data.iloc[0]):
-        waterfall_data.append({
-            "feature": feat,
-            "value": float(shap_val),
-            "start": float(cumulative),
-            "end": float(cumulative + shap_val),
-            "feature_value": float(feat_val)
-        })
-        cumulative += shap_val
-
-    # Sort features by absolute SHAP value (keep Base at index 0)
-    base_item = waterfall_data[0]
-    feature_items = waterfall_data[1:]
-    feature_items_sorted = sorted(feature_items, key=lambda x: abs(x['value']), reverse=True)
-    waterfall_data_sorted = [base_item] + feature_items_sorted
+    }] + [{
+        "feature": feature_names[i],
+        "value": round(values[i], WATERFALL_DECIMALS),
+        "start": round(starts[i], WATERFALL_DECIMALS),
+        "end": round(ends[i], WATERFALL_DECIMALS),
+        "feature_value": float(feature_values[i])
+    } for i in order]
 
     return {
         'base_value': base_value,
         'final_prediction': final_prediction,
-        'shap_values': {feat: float(val) for feat, val in zip(feature_names, shap_values_individual)},
+        'shap_values': dict(zip(feature_names, values)),
         'waterfall_data': waterfall_data_sorted
     }
 
 
+@lru_cache(maxsize=1)
 def get_global_feature_importance():
     """
     Get global feature importance using mean absolute SHAP values.
 
+    Depends only on the cached global SHAP sample, so the sorted result is
+    built once and reused by every request.
+
     Returns:
         dict: Feature importance scores
     """
-    model_data = load_xgboost_model()
-    shap_values = model_data['shap_values']
-    X_sample = model_data['X_sample']
-
-    # Calculate mean absolute SHAP values
-    mean_shap_values = np.abs(shap_values).mean(axis=0)
-    feature_names = X_sample.columns.tolist()
-
-    # Create feature importance data
-    importance_data = []
-    for feat, val in zip(feature_names, mean_shap_values):
-        importance_data.append({
-            "feature": feat,
-            "importance": float(val)
-        })
-
-    # Sort by importance descending
-    importance_data_sorted = sorted(importance_data, key=lambda x: x['importance'], reverse=True)
+    global_shap = get_global_shap_values()
+
+    # Mean absolute SHAP values are precomputed with the cached sample
+    mean_shap_values = global_shap['mean_shap_values']
+    feature_names = global_shap['feature_names']
+
+    # Create feature importance data, sorted by importance descending
+    importance_data_sorted = sorted(
+        (
+            {"feature": feat, "importance": float(val)}
+            for feat, val in zip(feature_names, mean_shap_values)
+        ),
+        key=lambda x: x['importance'],
+        reverse=True
+    )
 
     return {
         'feature_importance': importance_data_sorted
@@ -212,8 +358,6 @@ def get_xgboost_metrics():
     y_test = model_data['y_test']
 
     # Calculate metrics
-    from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score
-
     predictions = model.predict(X_test)
 
     return {
@@ -4,9 +4,18 @@ Endpoints for making predictions with Decision Tree and XGBoost models.
 """
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field, validator
 from typing import Literal
 
+# orjson serializes float-heavy SHAP payloads much faster than stdlib json;
+# fall back to the default response class if it isn't installed
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as SHAPResponse
+except ImportError:
+    SHAPResponse = JSONResponse
+
 from models.decision_tree import (
     predict_single,
     predict_decision_tree,
@@ -118,6 +127,18 @@ class SHAPExplanationResponse(BaseModel):
     waterfall_data: list[dict] = Field(..., description="Waterfall chart data sorted by importance")
 
 
+class SHAPComparisonInput(BaseModel):
+    """Input model for explaining two passengers in one request."""
+    cohort_a: PassengerInput = Field(..., description="First passenger to explain")
+    cohort_b: PassengerInput = Field(..., description="Second passenger to explain")
+
+
+class SHAPComparisonResponse(BaseModel):
+    """Response model for paired SHAP explanations."""
+    cohort_a: SHAPExplanationResponse = Field(..., description="SHAP explanation for cohort A")
+    cohort_b: SHAPExplanationResponse = Field(..., description="SHAP explanation for cohort B")
+
+
 # Prediction endpoints
 @router.post("/predict", response_model=PredictionOutput)
 async def predict(passenger: PassengerInput):
@@ -244,7 +265,7 @@ async def predict_with_both_models(passenger: PassengerInput):
 
 
 # SHAP explanation endpoints
-@router.post("/explain/shap", response_model=SHAPExplanationResponse)
+@router.post("/explain/shap", response_model=SHAPExplanationResponse, response_class=SHAPResponse)
 async def get_shap_values(passenger: PassengerInput):
     """
     Get SHAP explanation for an XGBoost prediction.
@@ -263,7 +284,34 @@ async def get_shap_values(passenger: PassengerInput):
         raise HTTPException(status_code=500, detail=f"SHAP explanation failed: {str(e)}")
 
 
-@router.get("/explain/global-importance")
+@router.post("/explain/shap/compare", response_model=SHAPComparisonResponse, response_class=SHAPResponse)
+async def get_shap_comparison(cohorts: SHAPComparisonInput):
+    """
+    Get SHAP explanations for two passengers in a single request.
+
+    Used by the comparison view so both waterfall charts are filled by one
+    round-trip instead of two.
+    """
+    try:
+        return {
+            "cohort_a": get_shap_explanation(
+                sex=cohorts.cohort_a.sex,
+                pclass=cohorts.cohort_a.pclass,
+                age=cohorts.cohort_a.age,
+                fare=cohorts.cohort_a.fare
+            ),
+            "cohort_b": get_shap_explanation(
+                sex=cohorts.cohort_b.sex,
+                pclass=cohorts.cohort_b.pclass,
+                age=cohorts.cohort_b.age,
+                fare=cohorts.cohort_b.fare
+            )
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"SHAP explanation failed: {str(e)}")
+
+
+@router.get("/explain/global-importance", response_class=SHAPResponse)
 async def get_global_importance():
     """
     Get global feature importance using mean absolute SHAP values.
@@ -4,9 +4,11 @@ Endpoints for retrieving decision tree structure for visualization.
 """
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import Response
 from pydantic import BaseModel, Field
 from typing import List, Dict, Any, Optional
 from functools import lru_cache
+import json
 
 from models.decision_tree import get_trained_model, get_tree_structure, get_model_metrics
 
@@ -80,11 +82,10 @@ def _get_cached_tree_response() -> dict:
     Returns:
         dict: Complete tree response with all required fields
     """
-    # Get tree structure (already uses sklearn_tree_to_dict from original code)
-    tree_structure = get_tree_structure()
-
-    # Get trained model for feature names
+    # Load the cached model data once; it already holds the tree structure
+    # (built with sklearn_tree_to_dict from original code) and feature names
     model_data = get_trained_model()
+    tree_structure = model_data['tree']
     feature_names = model_data['feature_names']
 
     # Get model metrics (accuracy, recall on test set)
@@ -97,7 +98,34 @@ def _get_cached_tree_response() -> dict:
     }
 
 
-@router.get("/tree", response_model=TreeResponse)
+@lru_cache(maxsize=1)
+def _get_cached_tree_json() -> bytes:
+    """
+    Get the tree response serialized to JSON bytes.
+
+    The payload is static, so it is validated and encoded once instead of
+    running response-model validation and JSON encoding on every request.
+
+    Returns:
+        bytes: UTF-8 JSON body for GET /api/tree
+    """
+    response = TreeResponse(**_get_cached_tree_response()).model_dump()
+    return json.dumps(
+        response,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":")
+    ).encode("utf-8")
+
+
+# The body is pre-serialized bytes, so FastAPI does not validate it against
+# TreeResponse here; that happens once inside _get_cached_tree_json.
+# TreeResponse is declared only to document the schema in OpenAPI
+@router.get(
+    "/tree",
+    response_class=Response,
+    responses={200: {"model": TreeResponse, "description": "Decision tree with metrics"}}
+)
 async def get_tree_with_metrics():
     """
     Get the complete decision tree structure with metrics.
@@ -128,7 +156,7 @@ async def get_tree_with_metrics():
     The result is cached as it doesn't change during runtime.
     """
     try:
-        return _get_cached_tree_response()
+        return Response(content=_get_cached_tree_json(), media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to retrieve tree: {str(e)}")
 
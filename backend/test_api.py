@@ -455,6 +455,46 @@ def test_prediction_consistency(client):
         assert response["survival_rate"] == first["survival_rate"]
 
 
+def test_shap_explanation_consistency(client):
+    """
+    Test that repeated SHAP requests (served from the per-passenger cache)
+    return identical explanations.
+    """
+    passenger = {
+        "sex": 1,
+        "pclass": 3,
+        "age": 30.0,
+        "fare": 13.0
+    }
+
+    responses = [
+        client.post("/api/explain/shap", json=passenger)
+        for _ in range(2)
+    ]
+
+    assert all(response.status_code == 200 for response in responses)
+    assert responses[0].json() == responses[1].json()
+
+
+def test_shap_comparison_matches_single_explanations(client):
+    """
+    Test that /api/explain/shap/compare returns the same explanations as
+    two separate /api/explain/shap requests.
+    """
+    cohort_a = {"sex": 0, "pclass": 1, "age": 30.0, "fare": 84.0}
+    cohort_b = {"sex": 1, "pclass": 3, "age": 30.0, "fare": 13.0}
+
+    response = client.post(
+        "/api/explain/shap/compare",
+        json={"cohort_a": cohort_a, "cohort_b": cohort_b}
+    )
+    assert response.status_code == 200
+    data = response.json()
+
+    assert data["cohort_a"] == client.post("/api/explain/shap", json=cohort_a).json()
+    assert data["cohort_b"] == client.post("/api/explain/shap", json=cohort_b).json()
+
+
 def test_survival_rate_calculation(client):
     """
     Test that survival_rate is correctly calculated as probability * 100.
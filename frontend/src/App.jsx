@@ -6,7 +6,7 @@ import WhatIfModal from './components/WhatIfModal'
 import useTutorial from './hooks/useTutorial'
 import useInitialAnimation from './hooks/useInitialAnimation'
 import useReplayAnimation from './hooks/useReplayAnimation'
-import { formatPassengerDescription, detectComparison, generateCohortLabel } from './utils/cohortPatterns'
+import { formatPassengerDescription, detectComparison, generateCohortLabel, isSamePassenger } from './utils/cohortPatterns'
 
 function App() {
   const [passengerData, setPassengerData] = useState({
@@ -16,13 +16,13 @@ function App() {
     fare: 84      // 0-100 (standard 1st class fare)
   })
 
-  const initialPassengerDesc = formatPassengerDescription(0, 1, 8, 84)
-  const [chatMessages, setChatMessages] = useState([
+  // Lazy initial state: the opening card's label is only formatted once
+  const [chatMessages, setChatMessages] = useState(() => [
     {
       role: 'assistant',
       type: 'prediction',
       passengerData: { sex: 0, pclass: 1, age: 8, fare: 84 },
-      label: initialPassengerDesc
+      label: formatPassengerDescription(0, 1, 8, 84)
     }
   ])
   const [hasQuery, setHasQuery] = useState(true) // Set to true so visualizations show on load
@@ -52,7 +52,9 @@ function App() {
 
   // Handle preset selection - update all values at once
   const handlePresetSelect = (presetValues) => {
-    setPassengerData(presetValues)
+    // Keep the current object when re-selecting the same passenger so
+    // charts and effects keyed on it don't redraw
+    setPassengerData(prev => isSamePassenger(prev, presetValues) ? prev : presetValues)
     setHasQuery(true) // Mark that user has made a query
     setActiveComparison(null) // Clear any active comparison
   }
@@ -121,7 +123,7 @@ function App() {
   // Handle percentage click - highlight cohort path on decision tree
   const handleHighlightCohort = (cohortData, comparisonData, messageIndex) => {
     // Update passenger data to show the path for this cohort
-    setPassengerData({ ...cohortData })
+    setPassengerData(prev => isSamePassenger(prev, cohortData) ? prev : { ...cohortData })
     setHasQuery(true)
 
     if (comparisonData) {
@@ -157,7 +159,7 @@ function App() {
     const passengerDesc = formatPassengerDescription(sex, pclass, age, fare)
 
     // Update main passenger data
-    setPassengerData(whatIfData)
+    setPassengerData(prev => isSamePassenger(prev, whatIfData) ? prev : whatIfData)
     setHasQuery(true)
     setActiveComparison(null)
 
@@ -265,8 +267,8 @@ function App() {
 
     const { sex, pclass, age, fare } = parsedParams
 
-    // Update passenger data
-    setPassengerData({ sex, pclass, age, fare })
+    // Update passenger data (unchanged passenger keeps the same object, so no redraw)
+    setPassengerData(prev => isSamePassenger(prev, parsedParams) ? prev : { sex, pclass, age, fare })
 
     const passengerDesc = formatPassengerDescription(sex, pclass, age, fare)
 
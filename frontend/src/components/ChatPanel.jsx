@@ -5,6 +5,14 @@ import ComparisonCard from './ComparisonCard'
 import SinglePredictionCard from './SinglePredictionCard'
 import './ChatPanel.css'
 
+// Suggestion buttons shown only when chat is empty. The queries are fixed,
+// so each one is parsed once here rather than on every click
+const SUGGESTIONS = [
+  "Compare women vs men",
+  "1st class male passenger",
+  "Children in 3rd class",
+].map(text => ({ text, parsedParams: parsePassengerQuery(text) }))
+
 /**
  * ChatPanel - Natural language chat interface with suggestion chips
  *
@@ -49,7 +57,7 @@ import './ChatPanel.css'
  * - Toggle state persists during session (via chipsVisible state)
  *
  * COMMON CHANGES:
- * - Add suggestion: Add to suggestionButtons array (line 98)
+ * - Add suggestion: Add to SUGGESTIONS array (top of file)
  * - Message spacing: Change space-y-3 to space-y-4, etc.
  * - Input styling: Modify className on <input> element
  * - Button colors: Change bg-[#218FCE] to other colors
@@ -129,13 +137,6 @@ function ChatPanel({ messages, onSendMessage, onPresetSelect, onPresetChat, onTu
     }
   }
 
-  // Suggestion buttons shown only when chat is empty
-  const suggestionButtons = [
-    "Compare women vs men",
-    "1st class male passenger",
-    "Children in 3rd class",
-  ]
-
   // Show chips until user types their own message (clicking chips doesn't count)
   const shouldShowChips = !hasTypedMessage
 
@@ -152,20 +153,21 @@ function ChatPanel({ messages, onSendMessage, onPresetSelect, onPresetChat, onTu
           </div>
         ) : (
           (() => {
-            // Group messages into sections (user request + assistant response(s))
+            // Group messages into sections (user request + assistant response(s)),
+            // keeping each message's index so rendering needs no indexOf lookups
             const sections = []
             let currentSection = []
 
-            messages.forEach((msg, idx) => {
+            messages.forEach((msg, globalIdx) => {
               if (msg.role === 'user') {
                 // Start a new section
                 if (currentSection.length > 0) {
                   sections.push(currentSection)
                 }
-                currentSection = [msg]
+                currentSection = [{ msg, globalIdx }]
               } else {
                 // Add to current section
-                currentSection.push(msg)
+                currentSection.push({ msg, globalIdx })
               }
             })
 
@@ -176,7 +178,7 @@ function ChatPanel({ messages, onSendMessage, onPresetSelect, onPresetChat, onTu
 
             return sections.map((section, sectionIdx) => {
               // Check if this section contains the active message
-              const containsActiveMessage = section.some(msg => messages.indexOf(msg) === activeMessageIndex)
+              const containsActiveMessage = section.some(({ globalIdx }) => globalIdx === activeMessageIndex)
               const sectionBg = containsActiveMessage ? UI_COLORS.chatSectionBgLatest : UI_COLORS.chatSectionBgPrevious
 
               return (
@@ -185,8 +187,7 @@ function ChatPanel({ messages, onSendMessage, onPresetSelect, onPresetChat, onTu
                   className="rounded-lg p-3 space-y-3"
                   style={{ backgroundColor: sectionBg }}
                 >
-                  {section.map((msg, msgIdx) => {
-                    const globalIdx = messages.indexOf(msg)
+                  {section.map(({ msg, globalIdx }, msgIdx) => {
                     const isNewMessage = globalIdx >= prevMessageCount
                     const animationClass = isNewMessage ? 'chat-message-new' : 'chat-message'
 
@@ -288,11 +289,10 @@ function ChatPanel({ messages, onSendMessage, onPresetSelect, onPresetChat, onTu
           {chipsVisible && (
             <>
               <div className="flex flex-wrap gap-2 mb-3">
-                {suggestionButtons.map((suggestion, idx) => (
+                {SUGGESTIONS.map(({ text: suggestion, parsedParams }, idx) => (
                   <button
                       key={idx}
                       onClick={() => {
-                        const parsedParams = parsePassengerQuery(suggestion)
                         if (parsedParams) {
                           onSendMessage(suggestion, parsedParams)
                         }
@@ -1,5 +1,6 @@
 import { useEffect, useState } from 'react'
 import { UI_COLORS, FONT_WEIGHTS, FONTS } from '../utils/uiStyles'
+import { API_URL } from '../utils/api'
 
 /**
  * ComparisonCard - Shows side-by-side survival predictions for two cohorts
@@ -31,15 +32,14 @@ function ComparisonCard({ cohortA, cohortB, labelA, labelB, description, onEdit,
     const fetchPredictions = async () => {
       setLoading(true)
       try {
-        const apiUrl = import.meta.env.VITE_API_URL || window.location.origin
         // Fetch both predictions in parallel
         const [responseA, responseB] = await Promise.all([
-          fetch(`${apiUrl}/api/predict/both`, {
+          fetch(`${API_URL}/api/predict/both`, {
             method: 'POST',
             headers: { 'Content-Type': 'application/json' },
             body: JSON.stringify(cohortA)
           }),
-          fetch(`${apiUrl}/api/predict/both`, {
+          fetch(`${API_URL}/api/predict/both`, {
             method: 'POST',
             headers: { 'Content-Type': 'application/json' },
             body: JSON.stringify(cohortB)
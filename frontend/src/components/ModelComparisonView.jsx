@@ -1,6 +1,8 @@
+import { useMemo } from 'react'
 import useFetchTree from '../hooks/useFetchTree'
 import usePredictBoth from '../hooks/usePredictBoth'
 import useSHAPExplanation from '../hooks/useSHAPExplanation'
+import useSHAPComparison from '../hooks/useSHAPComparison'
 import useGlobalImportance from '../hooks/useGlobalImportance'
 import DecisionTreeVizHorizontal from './visualizations/DecisionTreeVizHorizontal'
 import SHAPWaterfall from './visualizations/SHAPWaterfall'
@@ -30,18 +32,28 @@ import { formatPassengerDescription } from '../utils/cohortPatterns'
 function ModelComparisonView({ passengerData, highlightMode = null, highlightFeatures = null, activeComparison = null, hasQuery = false, onEditClick = null }) {
   const { data: treeData, loading: treeLoading } = useFetchTree()
   const { data: predictions, loading: predictionsLoading, error: predictionsError } = usePredictBoth(passengerData)
-  const { data: shapData, loading: shapLoading } = useSHAPExplanation(passengerData)
+  // Comparison mode shows only the two cohort waterfalls, so the single
+  // passenger explanation is fetched only outside of it
+  const showComparison = Boolean(activeComparison && hasQuery)
+  const { data: shapData, loading: shapLoading } = useSHAPExplanation(showComparison ? null : passengerData)
 
-  // Fetch SHAP data for both cohorts when in comparison mode
-  const { data: shapDataA, loading: shapLoadingA } = useSHAPExplanation(
-    activeComparison?.cohortA || passengerData
-  )
-  const { data: shapDataB, loading: shapLoadingB } = useSHAPExplanation(
-    activeComparison?.cohortB || passengerData
+  // Fetch SHAP data for both cohorts in one request, only when comparison mode is shown
+  const { data: shapComparison, loading: shapComparisonLoading } = useSHAPComparison(
+    showComparison ? activeComparison : null
   )
+  const shapDataA = shapComparison?.cohort_a
+  const shapDataB = shapComparison?.cohort_b
 
   const { data: globalImportance, loading: globalLoading } = useGlobalImportance()
 
+  // Map once per fetch so chat-driven rerenders don't hand the chart a new array
+  const globalImportanceData = useMemo(() => (
+    globalImportance?.feature_importance?.map(item => ({
+      feature: item.feature,
+      value: item.importance
+    })) || null
+  ), [globalImportance])
+
   if (treeLoading) {
     return (
       <div className="space-y-8 w-full">
@@ -132,14 +144,14 @@ function ModelComparisonView({ passengerData, highlightMode = null, highlightFea
           </div>
 
         {/* Comparison Mode: 2 waterfalls side-by-side, global underneath */}
-        {activeComparison && hasQuery ? (
+        {showComparison ? (
           <>
             {/* Two comparison waterfalls side by side */}
             <div className={`grid grid-cols-2 mb-6`}>
               {/* Cohort A Waterfall */}
               <div className="rounded-lg pt-6 pr-6">
                 <ErrorBoundary errorTitle="SHAP Waterfall Error (Cohort A)">
-                  {shapLoadingA ? (
+                  {shapComparisonLoading ? (
                     <LoadingSkeleton variant="chart" />
                   ) : shapDataA ? (
                     <SHAPWaterfall
@@ -158,7 +170,7 @@ function ModelComparisonView({ passengerData, highlightMode = null, highlightFea
               {/* Cohort B Waterfall */}
               <div className="rounded-lg pt-6 pl-6">
                 <ErrorBoundary errorTitle="SHAP Waterfall Error (Cohort B)">
-                  {shapLoadingB ? (
+                  {shapComparisonLoading ? (
                     <LoadingSkeleton variant="chart" />
                   ) : shapDataB ? (
                     <SHAPWaterfall
@@ -180,13 +192,8 @@ function ModelComparisonView({ passengerData, highlightMode = null, highlightFea
               <ErrorBoundary errorTitle="Feature Importance Error">
                 {globalLoading ? (
                   <LoadingSkeleton variant="chart" />
-                ) : globalImportance?.feature_importance ? (
-                  <GlobalFeatureImportance
-                    data={globalImportance.feature_importance.map(item => ({
-                      feature: item.feature,
-                      value: item.importance
-                    }))}
-                  />
+                ) : globalImportanceData ? (
+                  <GlobalFeatureImportance data={globalImportanceData} />
                 ) : (
                   <LoadingSkeleton variant="chart" />
                 )}
@@ -220,13 +227,8 @@ function ModelComparisonView({ passengerData, highlightMode = null, highlightFea
               <ErrorBoundary errorTitle="Feature Importance Error">
                 {globalLoading ? (
                   <LoadingSkeleton variant="chart" />
-                ) : globalImportance?.feature_importance ? (
-                  <GlobalFeatureImportance
-                    data={globalImportance.feature_importance.map(item => ({
-                      feature: item.feature,
-                      value: item.importance
-                    }))}
-                  />
+                ) : globalImportanceData ? (
+                  <GlobalFeatureImportance data={globalImportanceData} />
                 ) : (
                   <LoadingSkeleton variant="chart" />
                 )}
@@ -1,5 +1,6 @@
 import { useEffect, useState } from 'react'
 import { UI_COLORS, FONT_WEIGHTS, FONTS } from '../utils/uiStyles'
+import { API_URL } from '../utils/api'
 
 /**
  * SinglePredictionCard - Shows survival predictions for a single passenger in chat
@@ -18,8 +19,7 @@ function SinglePredictionCard({ passengerData, label, onEdit, onHighlightCohort,
     const fetchPrediction = async () => {
       setLoading(true)
       try {
-        const apiUrl = import.meta.env.VITE_API_URL || window.location.origin
-        const response = await fetch(`${apiUrl}/api/predict/both`, {
+        const response = await fetch(`${API_URL}/api/predict/both`, {
           method: 'POST',
           headers: { 'Content-Type': 'application/json' },
           body: JSON.stringify(passengerData)
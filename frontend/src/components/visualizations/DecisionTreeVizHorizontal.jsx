@@ -2,6 +2,291 @@ import { useEffect, useRef, useState } from 'react'
 import * as d3 from 'd3'
 import { FONTS, FONT_WEIGHTS, TREE_COLORS, TREE_EFFECTS, TREE_OPACITY, TREE_STROKE, TREE_SIZING } from '../../utils/visualizationStyles'
 
+// Tree CSS depends only on the imported style constants, so build the string
+// once at module load instead of on every render
+const TREE_STYLES = `
+  .zoom-group {
+    cursor: grab;
+  }
+
+  .zoom-group:active {
+    cursor: grabbing;
+  }
+
+  .pie-chart {
+    transition: transform 0.2s ease;
+  }
+
+  .pie-chart.hovered {
+    transform: scale(1.25);
+  }
+
+  .pie-chart path {
+    opacity: ${TREE_OPACITY.inactive};
+    transition: opacity 0.3s ease, filter 0.3s ease;
+  }
+
+  .pie-chart.active path {
+    opacity: ${TREE_OPACITY.active};
+    filter: ${TREE_EFFECTS.active};
+  }
+
+  .pie-chart.hover-active path {
+    opacity: ${TREE_OPACITY.hover};
+    filter: ${TREE_EFFECTS.hover};
+  }
+
+  .pie-chart.final path {
+    filter: ${TREE_EFFECTS.final};
+  }
+
+  .pie-chart.final {
+    animation: pulse 1.5s ease-in-out infinite;
+  }
+
+  @keyframes pulse {
+    0%, 100% { transform: scale(1); }
+    50% { transform: scale(1.1); }
+  }
+
+  .node text.feature-label {
+    font-size: 12px;
+    font-weight: ${FONT_WEIGHTS.normal};
+    fill: ${TREE_COLORS.textDefault};
+    opacity: ${TREE_OPACITY.inactive};
+    transition: opacity 0.3s ease;
+  }
+
+  .node text.feature-label.active {
+    opacity: ${TREE_OPACITY.active};
+    font-weight: ${FONT_WEIGHTS.normal};
+    fill: ${TREE_COLORS.textDefault};
+  }
+
+  .node text.feature-label.hover-active {
+    opacity: ${TREE_OPACITY.hover};
+    fill: ${TREE_COLORS.hover};
+  }
+
+  /* Prediction labels - hidden by default, shown when highlighted */
+  .node text.prediction-label {
+    font-size: ${FONTS.tree.predictionLabel};
+    font-weight: ${FONT_WEIGHTS.normal};
+    fill: ${TREE_COLORS.textDefault};
+    opacity: 0;
+    transition: opacity 0.3s ease, fill 0.3s ease, font-size 0.3s ease, font-weight 0.3s ease, transform 0.3s ease, filter 0.3s ease;
+  }
+
+  .node text.prediction-label.active,
+  .node text.prediction-label.tutorial-highlight,
+  .node text.prediction-label.path-a,
+  .node text.prediction-label.path-b,
+  .node text.prediction-label.path-shared {
+    opacity: ${TREE_OPACITY.active};
+    font-weight: ${FONT_WEIGHTS.normal};
+    font-size: ${FONTS.tree.predictionLabelHighlight};
+    fill: white;
+    transform: translateY(${TREE_SIZING.labelOffset.leafHighlight}px);
+    filter: ${TREE_EFFECTS.labelShadow};
+  }
+
+  /* Keep survival rate (third tspan) bold, not parentheses */
+  .node text.prediction-label.active tspan:nth-child(3),
+  .node text.prediction-label.tutorial-highlight tspan:nth-child(3),
+  .node text.prediction-label.path-a tspan:nth-child(3),
+  .node text.prediction-label.path-b tspan:nth-child(3),
+  .node text.prediction-label.path-shared tspan:nth-child(3) {
+    font-weight: ${FONT_WEIGHTS.predictionLabelHighlight};
+  }
+
+  .node text.prediction-label.tutorial-highlight {
+    fill: ${TREE_COLORS.tutorial};
+  }
+
+  .node text.prediction-label.path-a {
+    fill: ${TREE_COLORS.comparisonA};
+  }
+
+  .node text.prediction-label.path-b {
+    fill: ${TREE_COLORS.comparisonB};
+  }
+
+  .node text.prediction-label.path-shared {
+    fill: ${TREE_COLORS.comparisonShared};
+  }
+
+  .link {
+    fill: none;
+    stroke: ${TREE_COLORS.defaultStroke};
+    stroke-linecap: round;
+    stroke-opacity: 0.6;
+    transition: stroke 0.3s ease, opacity 0.3s ease;
+  }
+
+  .link.active {
+    opacity: ${TREE_OPACITY.active};
+  }
+
+  .link.active.survived {
+    stroke: ${TREE_COLORS.survived};
+  }
+
+  .link.active.died {
+    stroke: ${TREE_COLORS.died};
+  }
+
+  .link.hover-active {
+    stroke: ${TREE_COLORS.hover};
+    opacity: 0.8;
+  }
+
+  .edge-label {
+    font-size: 11px;
+    fill: ${TREE_COLORS.textDefault};
+    font-weight: ${FONT_WEIGHTS.semibold};
+    opacity: ${TREE_OPACITY.inactive};
+    transition: opacity 0.3s ease, fill 0.3s ease, font-size 0.3s ease, font-weight 0.3s ease, filter 0.3s ease;
+  }
+
+  .edge-label.active {
+    opacity: ${TREE_OPACITY.active};
+    font-weight: ${FONT_WEIGHTS.edgeLabelHighlight};
+    font-size: ${FONTS.tree.edgeLabelHighlight};
+    filter: ${TREE_EFFECTS.labelShadow};
+  }
+
+  .edge-label.hover-active {
+    opacity: ${TREE_OPACITY.hover};
+    fill: ${TREE_COLORS.hover};
+    font-size: ${FONTS.tree.edgeLabelHighlight};
+    font-weight: ${FONT_WEIGHTS.edgeLabelHighlight};
+    filter: ${TREE_EFFECTS.labelShadow};
+  }
+
+  .pie-chart.tutorial-highlight path {
+    opacity: ${TREE_OPACITY.active};
+    filter: ${TREE_EFFECTS.tutorial};
+  }
+
+  .link.tutorial-highlight {
+    stroke: ${TREE_COLORS.tutorial};
+    opacity: ${TREE_OPACITY.active};
+  }
+
+  /* RULE: Leaf value colors override tutorial highlight color */
+  .link.tutorial-highlight.survived {
+    stroke: ${TREE_COLORS.survived} !important;
+  }
+
+  .link.tutorial-highlight.died {
+    stroke: ${TREE_COLORS.died} !important;
+  }
+
+  .node text.tutorial-highlight {
+    opacity: ${TREE_OPACITY.active};
+    font-weight: ${FONT_WEIGHTS.normal};
+    fill: ${TREE_COLORS.tutorial};
+  }
+
+  .edge-label.tutorial-highlight {
+    opacity: ${TREE_OPACITY.active};
+    font-weight: ${FONT_WEIGHTS.edgeLabelHighlight};
+    fill: ${TREE_COLORS.tutorial};
+    font-size: ${FONTS.tree.edgeLabelHighlight};
+    filter: ${TREE_EFFECTS.labelShadow};
+  }
+
+  .pie-chart.path-a path {
+    opacity: ${TREE_OPACITY.active};
+    filter: ${TREE_EFFECTS.comparisonA};
+  }
+
+  .link.path-a {
+    stroke: ${TREE_COLORS.comparisonA};
+    opacity: ${TREE_OPACITY.active};
+  }
+
+  /* RULE: Leaf value colors override cohort colors */
+  .link.path-a.survived {
+    stroke: ${TREE_COLORS.survived} !important;
+  }
+
+  .link.path-a.died {
+    stroke: ${TREE_COLORS.died} !important;
+  }
+
+  .node text.path-a {
+    opacity: ${TREE_OPACITY.active};
+    font-weight: ${FONT_WEIGHTS.normal};
+    fill: ${TREE_COLORS.comparisonA};
+  }
+
+  .edge-label.path-a {
+    opacity: ${TREE_OPACITY.active};
+    font-weight: ${FONT_WEIGHTS.edgeLabelHighlight};
+    fill: ${TREE_COLORS.textDefault};
+    font-size: ${FONTS.tree.edgeLabelHighlight};
+    filter: ${TREE_EFFECTS.labelShadow};
+  }
+
+  .pie-chart.path-b path {
+    opacity: ${TREE_OPACITY.active};
+    filter: ${TREE_EFFECTS.comparisonB};
+  }
+
+  .link.path-b {
+    stroke: ${TREE_COLORS.comparisonB};
+    opacity: ${TREE_OPACITY.active};
+  }
+
+  /* RULE: Leaf value colors override cohort colors */
+  .link.path-b.survived {
+    stroke: ${TREE_COLORS.survived} !important;
+  }
+
+  .link.path-b.died {
+    stroke: ${TREE_COLORS.died} !important;
+  }
+
+  .node text.path-b {
+    opacity: ${TREE_OPACITY.active};
+    font-weight: ${FONT_WEIGHTS.normal};
+    fill: ${TREE_COLORS.comparisonB};
+  }
+
+  .edge-label.path-b {
+    opacity: ${TREE_OPACITY.active};
+    font-weight: ${FONT_WEIGHTS.edgeLabelHighlight};
+    fill: ${TREE_COLORS.textDefault};
+    font-size: ${FONTS.tree.edgeLabelHighlight};
+    filter: ${TREE_EFFECTS.labelShadow};
+  }
+
+  .pie-chart.path-shared path {
+    opacity: ${TREE_OPACITY.active};
+    filter: ${TREE_EFFECTS.comparisonShared};
+  }
+
+  .link.path-shared {
+    stroke: ${TREE_COLORS.comparisonShared} !important;
+    opacity: ${TREE_OPACITY.active} !important;
+  }
+
+  .node text.path-shared {
+    opacity: ${TREE_OPACITY.active};
+    font-weight: ${FONT_WEIGHTS.normal};
+    fill: ${TREE_COLORS.comparisonShared};
+  }
+
+  .edge-label.path-shared {
+    opacity: ${TREE_OPACITY.active};
+    font-weight: ${FONT_WEIGHTS.edgeLabelHighlight};
+    fill: ${TREE_COLORS.textDefault};
+    font-size: ${FONTS.tree.edgeLabelHighlight};
+    filter: ${TREE_EFFECTS.labelShadow};
+  }
+`
+
 /**
  * DecisionTreeVizHorizontal - Horizontal (left-to-right) decision tree visualization
  *
@@ -20,6 +305,7 @@ function DecisionTreeVizHorizontal({ treeData, passengerValues, width, height =
   const [containerWidth, setContainerWidth] = useState(0)
   const [treeVersion, setTreeVersion] = useState(0)
   const d3TreeRef = useRef(null)
+  const nodeByIdRef = useRef(null)
   const zoomRef = useRef(null)
   const svgContainerRef = useRef(null)
 
@@ -50,15 +336,7 @@ function DecisionTreeVizHorizontal({ treeData, passengerValues, width, height =
 
   // Helper function: Get path from root to a specific node (for hover highlighting)
   const getPathToNode = (targetNode) => {
-    const path = []
-    let current = targetNode
-
-    while (current) {
-      path.unshift(current.data.id)
-      current = current.parent
-    }
-
-    return path
+    return targetNode.ancestors().map(node => node.data.id).reverse()
   }
 
   // Helper function: Limit path based on highlightMode
@@ -84,6 +362,8 @@ function DecisionTreeVizHorizontal({ treeData, passengerValues, width, height =
 
     const svg = svgRef.current
     const finalNodeId = path && path.length > 0 ? path[path.length - 1] : null
+    const pathSet = new Set(path || [])
+    const finalNode = finalNodeId !== null ? nodeByIdRef.current.get(finalNodeId) : null
     const highlightClass = isTutorialMode ? 'tutorial-highlight' : 'active'
     const otherClass = isTutorialMode ? 'active' : 'tutorial-highlight'
 
@@ -98,9 +378,8 @@ function DecisionTreeVizHorizontal({ treeData, passengerValues, width, height =
     // Then reapply the highlight class (forces CSS transition restart)
     svg.selectAll('.pie-chart')
       .classed(highlightClass, function() {
-        if (!path || path.length === 0) return false
         const nodeData = d3.select(this.parentNode).datum()
-        return path.includes(nodeData.data.id)
+        return pathSet.has(nodeData.data.id)
       })
       .classed('final', function() {
         if (!finalNodeId) return false
@@ -118,7 +397,7 @@ function DecisionTreeVizHorizontal({ treeData, passengerValues, width, height =
 
     // Reapply highlight to feature labels
     svg.selectAll('.node text.feature-label')
-      .classed(highlightClass, d => path && path.length > 0 && path.includes(d.data.id))
+      .classed(highlightClass, d => pathSet.has(d.data.id))
 
     // Clear classes from prediction labels
     svg.selectAll('.node text.prediction-label')
@@ -130,7 +409,7 @@ function DecisionTreeVizHorizontal({ treeData, passengerValues, width, height =
 
     // Reapply highlight to prediction labels
     svg.selectAll('.node text.prediction-label')
-      .classed(highlightClass, d => path && path.length > 0 && path.includes(d.data.id))
+      .classed(highlightClass, d => pathSet.has(d.data.id))
 
     // Clear classes from links
     svg.selectAll('.link')
@@ -142,19 +421,17 @@ function DecisionTreeVizHorizontal({ treeData, passengerValues, width, height =
 
     // Reapply highlight to links
     svg.selectAll('.link')
-      .classed(highlightClass, d => path && path.length > 0 && path.includes(d.source.data.id) && path.includes(d.target.data.id))
+      .classed(highlightClass, d => pathSet.has(d.source.data.id) && pathSet.has(d.target.data.id))
       .classed('survived', d => {
         // RULE: Always apply survived/died colors based on leaf value, even in tutorial mode
-        if (path && path.length > 0 && finalNodeId && path.includes(d.source.data.id) && path.includes(d.target.data.id)) {
-          const finalNode = d3TreeRef.current.descendants().find(n => n.data.id === finalNodeId)
+        if (pathSet.has(d.source.data.id) && pathSet.has(d.target.data.id)) {
           return finalNode && finalNode.data.predicted_class === 1
         }
         return false
       })
       .classed('died', d => {
         // RULE: Always apply survived/died colors based on leaf value, even in tutorial mode
-        if (path && path.length > 0 && finalNodeId && path.includes(d.source.data.id) && path.includes(d.target.data.id)) {
-          const finalNode = d3TreeRef.current.descendants().find(n => n.data.id === finalNodeId)
+        if (pathSet.has(d.source.data.id) && pathSet.has(d.target.data.id)) {
           return finalNode && finalNode.data.predicted_class === 0
         }
         return false
@@ -176,7 +453,7 @@ function DecisionTreeVizHorizontal({ treeData, passengerValues, width, height =
 
     // Reapply highlight to edge labels
     svg.selectAll('.edge-label')
-      .classed(highlightClass, d => path && path.length > 0 && path.includes(d.source.data.id) && path.includes(d.target.data.id))
+      .classed(highlightClass, d => pathSet.has(d.source.data.id) && pathSet.has(d.target.data.id))
   }
 
   // Zoom control functions
@@ -209,17 +486,19 @@ function DecisionTreeVizHorizontal({ treeData, passengerValues, width, height =
     // Get final node IDs to determine leaf values (use limited paths)
     const finalNodeIdA = limitedPathA[limitedPathA.length - 1]
     const finalNodeIdB = limitedPathB[limitedPathB.length - 1]
-    const finalNodeA = d3TreeRef.current.descendants().find(n => n.data.id === finalNodeIdA)
-    const finalNodeB = d3TreeRef.current.descendants().find(n => n.data.id === finalNodeIdB)
+    const finalNodeA = nodeByIdRef.current.get(finalNodeIdA)
+    const finalNodeB = nodeByIdRef.current.get(finalNodeIdB)
 
     // Determine which class each path leads to (0 = died, 1 = survived)
     const pathAClass = finalNodeA ? finalNodeA.data.predicted_class : null
     const pathBClass = finalNodeB ? finalNodeB.data.predicted_class : null
 
     // Use limited paths for calculating shared/unique nodes
-    const sharedNodes = limitedPathA.filter(id => limitedPathB.includes(id))
-    const uniqueA = limitedPathA.filter(id => !limitedPathB.includes(id))
-    const uniqueB = limitedPathB.filter(id => !limitedPathA.includes(id))
+    const pathSetA = new Set(limitedPathA)
+    const pathSetB = new Set(limitedPathB)
+    const sharedNodes = new Set(limitedPathA.filter(id => pathSetB.has(id)))
+    const uniqueA = new Set(limitedPathA.filter(id => !pathSetB.has(id)))
+    const uniqueB = new Set(limitedPathB.filter(id => !pathSetA.has(id)))
 
     // STEP 1: Clear ALL classes from all elements (forces CSS transitions to restart)
     svg.selectAll('.pie-chart')
@@ -263,42 +542,42 @@ function DecisionTreeVizHorizontal({ treeData, passengerValues, width, height =
     svg.selectAll('.pie-chart')
       .classed('path-shared', function() {
         const nodeData = d3.select(this.parentNode).datum()
-        return sharedNodes.includes(nodeData.data.id)
+        return sharedNodes.has(nodeData.data.id)
       })
 
     svg.selectAll('.node text.feature-label, .node text.prediction-label')
-      .classed('path-shared', d => sharedNodes.includes(d.data.id))
+      .classed('path-shared', d => sharedNodes.has(d.data.id))
 
     svg.selectAll('.link')
-      .classed('path-shared', d => sharedNodes.includes(d.source.data.id) && sharedNodes.includes(d.target.data.id))
+      .classed('path-shared', d => sharedNodes.has(d.source.data.id) && sharedNodes.has(d.target.data.id))
 
     svg.selectAll('.edge-label')
-      .classed('path-shared', d => sharedNodes.includes(d.source.data.id) && sharedNodes.includes(d.target.data.id))
+      .classed('path-shared', d => sharedNodes.has(d.source.data.id) && sharedNodes.has(d.target.data.id))
 
     // STEP 3: Apply path-a classes
     svg.selectAll('.pie-chart')
       .classed('path-a', function() {
         const nodeData = d3.select(this.parentNode).datum()
-        return uniqueA.includes(nodeData.data.id)
+        return uniqueA.has(nodeData.data.id)
       })
 
     svg.selectAll('.node text.feature-label, .node text.prediction-label')
-      .classed('path-a', d => uniqueA.includes(d.data.id))
+      .classed('path-a', d => uniqueA.has(d.data.id))
 
     // Apply path-a to links
     svg.selectAll('.link')
       .classed('path-a', d => {
-        const sourceInPath = limitedPathA.includes(d.source.data.id)
-        const targetInPath = limitedPathA.includes(d.target.data.id)
-        const targetUnique = uniqueA.includes(d.target.data.id)
+        const sourceInPath = pathSetA.has(d.source.data.id)
+        const targetInPath = pathSetA.has(d.target.data.id)
+        const targetUnique = uniqueA.has(d.target.data.id)
         return sourceInPath && targetInPath && targetUnique
       })
 
     svg.selectAll('.edge-label')
       .classed('path-a', d => {
-        const sourceInPath = limitedPathA.includes(d.source.data.id)
-        const targetInPath = limitedPathA.includes(d.target.data.id)
-        const targetUnique = uniqueA.includes(d.target.data.id)
+        const sourceInPath = pathSetA.has(d.source.data.id)
+        const targetInPath = pathSetA.has(d.target.data.id)
+        const targetUnique = uniqueA.has(d.target.data.id)
         return sourceInPath && targetInPath && targetUnique
       })
 
@@ -306,54 +585,54 @@ function DecisionTreeVizHorizontal({ treeData, passengerValues, width, height =
     svg.selectAll('.pie-chart')
       .classed('path-b', function() {
         const nodeData = d3.select(this.parentNode).datum()
-        return uniqueB.includes(nodeData.data.id)
+        return uniqueB.has(nodeData.data.id)
       })
 
     svg.selectAll('.node text.feature-label, .node text.prediction-label')
-      .classed('path-b', d => uniqueB.includes(d.data.id))
+      .classed('path-b', d => uniqueB.has(d.data.id))
 
     // Apply path-b to links
     svg.selectAll('.link')
       .classed('path-b', d => {
-        const sourceInPath = limitedPathB.includes(d.source.data.id)
-        const targetInPath = limitedPathB.includes(d.target.data.id)
-        const targetUnique = uniqueB.includes(d.target.data.id)
+        const sourceInPath = pathSetB.has(d.source.data.id)
+        const targetInPath = pathSetB.has(d.target.data.id)
+        const targetUnique = uniqueB.has(d.target.data.id)
         return sourceInPath && targetInPath && targetUnique
       })
 
     svg.selectAll('.edge-label')
       .classed('path-b', d => {
-        const sourceInPath = limitedPathB.includes(d.source.data.id)
-        const targetInPath = limitedPathB.includes(d.target.data.id)
-        const targetUnique = uniqueB.includes(d.target.data.id)
+        const sourceInPath = pathSetB.has(d.source.data.id)
+        const targetInPath = pathSetB.has(d.target.data.id)
+        const targetUnique = uniqueB.has(d.target.data.id)
         return sourceInPath && targetInPath && targetUnique
       })
 
     // STEP 5: Apply survived/died colors (RULE: based on LEAF VALUE, not cohort)
     svg.selectAll('.link')
       .classed('survived', d => {
-        const sourceInPathA = limitedPathA.includes(d.source.data.id)
-        const targetInPathA = limitedPathA.includes(d.target.data.id)
-        const targetUniqueA = uniqueA.includes(d.target.data.id)
+        const sourceInPathA = pathSetA.has(d.source.data.id)
+        const targetInPathA = pathSetA.has(d.target.data.id)
+        const targetUniqueA = uniqueA.has(d.target.data.id)
         const isPathA = sourceInPathA && targetInPathA && targetUniqueA
 
-        const sourceInPathB = limitedPathB.includes(d.source.data.id)
-        const targetInPathB = limitedPathB.includes(d.target.data.id)
-        const targetUniqueB = uniqueB.includes(d.target.data.id)
+        const sourceInPathB = pathSetB.has(d.source.data.id)
+        const targetInPathB = pathSetB.has(d.target.data.id)
+        const targetUniqueB = uniqueB.has(d.target.data.id)
         const isPathB = sourceInPathB && targetInPathB && targetUniqueB
 
         // Color as 'survived' if either path leads to survived (class 1)
         return (isPathA && pathAClass === 1) || (isPathB && pathBClass === 1)
       })
       .classed('died', d => {
-        const sourceInPathA = limitedPathA.includes(d.source.data.id)
-        const targetInPathA = limitedPathA.includes(d.target.data.id)
-        const targetUniqueA = uniqueA.includes(d.target.data.id)
+        const sourceInPathA = pathSetA.has(d.source.data.id)
+        const targetInPathA = pathSetA.has(d.target.data.id)
+        const targetUniqueA = uniqueA.has(d.target.data.id)
         const isPathA = sourceInPathA && targetInPathA && targetUniqueA
 
-        const sourceInPathB = limitedPathB.includes(d.source.data.id)
-        const targetInPathB = limitedPathB.includes(d.target.data.id)
-        const targetUniqueB = uniqueB.includes(d.target.data.id)
+        const sourceInPathB = pathSetB.has(d.source.data.id)
+        const targetInPathB = pathSetB.has(d.target.data.id)
+        const targetUniqueB = uniqueB.has(d.target.data.id)
         const isPathB = sourceInPathB && targetInPathB && targetUniqueB
 
         // Color as 'died' if either path leads to died (class 0)
@@ -365,8 +644,8 @@ function DecisionTreeVizHorizontal({ treeData, passengerValues, width, height =
   useEffect(() => {
     if (!treeData || !containerRef.current) return
 
-    const container = containerRef.current
-    const actualWidth = width || container.offsetWidth
+    const actualWidth = width || containerWidth
+    if (!actualWidth) return
     const margin = { top: 20, right: 120, bottom: 20, left: 80 }
 
     // Clear existing content
@@ -416,6 +695,7 @@ function DecisionTreeVizHorizontal({ treeData, passengerValues, width, height =
     const root = d3.hierarchy(treeData, d => d.children)
     const treeLayout = tree(root)
     d3TreeRef.current = treeLayout
+    nodeByIdRef.current = new Map(treeLayout.descendants().map(node => [node.data.id, node]))
 
     // Add stroke width scale based on sample counts
     const maxSamples = d3.max(treeLayout.descendants(), d => d.data.samples)
@@ -470,6 +750,17 @@ function DecisionTreeVizHorizontal({ treeData, passengerValues, width, height =
         return isLeftChild ? (d.source.data.left_label || '') : (d.source.data.right_label || '')
       })
 
+    // Hover highlight targets per node id: its pie and label plus the link and
+    // edge label leading into it, filled in once all elements exist
+    const hoverElementsById = new Map()
+    let hoveredElements = []
+
+    const setHoverPath = (path) => {
+      hoveredElements.forEach(el => el.classList.remove('hover-active'))
+      hoveredElements = path.flatMap(id => hoverElementsById.get(id) || [])
+      hoveredElements.forEach(el => el.classList.add('hover-active'))
+    }
+
     const nodes = svg.selectAll(".node")
       .data(treeLayout.descendants())
       .enter()
@@ -513,36 +804,9 @@ function DecisionTreeVizHorizontal({ treeData, passengerValues, width, height =
         .attr("pointer-events", "all")
 
       hoverCircle.on("mouseover", function(event) {
-        pieGroup.transition()
-          .duration(200)
-          .attr("transform", "scale(1.25)")
-
-        const hoverPath = getPathToNode(d)
-        d3.selectAll('.pie-chart')
-          .classed('hover-active', function() {
-            const nodeData = d3.select(this.parentNode).datum()
-            return hoverPath.includes(nodeData.data.id)
-          })
-
-        d3.selectAll('.node text.feature-label')
-          .classed('hover-active', function() {
-            const nodeData = d3.select(this.parentNode).datum()
-            return hoverPath.includes(nodeData.data.id)
-          })
-
-        d3.selectAll('.link')
-          .classed('hover-active', function() {
-            const linkData = d3.select(this).datum()
-            return hoverPath.includes(linkData.source.data.id) &&
-                   hoverPath.includes(linkData.target.data.id)
-          })
-
-        d3.selectAll('.edge-label')
-          .classed('hover-active', function() {
-            const linkData = d3.select(this).datum()
-            return hoverPath.includes(linkData.source.data.id) &&
-                   hoverPath.includes(linkData.target.data.id)
-          })
+        pieGroup.classed('hovered', true)
+
+        setHoverPath(getPathToNode(d))
 
         const survivalRate = (d.data.probability * 100).toFixed(1)
         tooltip.transition()
@@ -558,14 +822,9 @@ function DecisionTreeVizHorizontal({ treeData, passengerValues, width, height =
           .style("top", (event.pageY - 28) + "px")
       })
       .on("mouseout", function() {
-        pieGroup.transition()
-          .duration(200)
-          .attr("transform", "scale(1)")
+        pieGroup.classed('hovered', false)
 
-        d3.selectAll('.pie-chart').classed('hover-active', false)
-        d3.selectAll('.node text.feature-label').classed('hover-active', false)
-        d3.selectAll('.link').classed('hover-active', false)
-        d3.selectAll('.edge-label').classed('hover-active', false)
+        setHoverPath([])
 
         tooltip.transition()
           .duration(500)
@@ -582,6 +841,13 @@ function DecisionTreeVizHorizontal({ treeData, passengerValues, width, height =
       .text(d => d.data.is_leaf ? "" : (d.data.feature || ""))
       .style("fill", TREE_COLORS.textDefault)
 
+    nodes.each(function(d) {
+      hoverElementsById.set(d.data.id, [this.querySelector('.pie-chart'), this.querySelector('text.feature-label')])
+    })
+    svg.selectAll('.link, .edge-label').each(function(d) {
+      hoverElementsById.get(d.target.data.id).push(this)
+    })
+
     // Labels for leaf nodes (Survived/Died) - shown only when highlighted
     nodes.each(function(d) {
       if (!d.data.is_leaf) return
@@ -624,7 +890,7 @@ function DecisionTreeVizHorizontal({ treeData, passengerValues, width, height =
       tooltip.remove()
       d3.selectAll(".tree-tooltip").remove()
     }
-  }, [treeData, width, height])
+  }, [treeData, width, height, containerWidth])
 
   // Update path highlighting
   useEffect(() => {
@@ -666,295 +932,26 @@ function DecisionTreeVizHorizontal({ treeData, passengerValues, width, height =
     updateTreeHighlight(limitedPath, isTutorialMode)
   }, [passengerValues, treeData, highlightMode, comparisonData, treeVersion])
 
-  // Handle window resize
+  // Measure the container once it has been laid out (it has no width while
+  // hidden). The tree is drawn once, so later resizes are not tracked.
   useEffect(() => {
-    if (!containerRef.current) return
+    if (width || !containerRef.current) return
 
     const resizeObserver = new ResizeObserver(entries => {
-      const { width } = entries[0].contentRect
-      setContainerWidth(width)
+      const { width: observedWidth } = entries[0].contentRect
+      if (observedWidth > 0) {
+        resizeObserver.disconnect()
+        setContainerWidth(observedWidth)
+      }
     })
 
     resizeObserver.observe(containerRef.current)
     return () => resizeObserver.disconnect()
-  }, [])
+  }, [width])
 
   return (
     <>
-      <style>{`
-        .zoom-group {
-          cursor: grab;
-        }
-
-        .zoom-group:active {
-          cursor: grabbing;
-        }
-
-        .pie-chart path {
-          opacity: ${TREE_OPACITY.inactive};
-          transition: all 0.3s ease;
-        }
-
-        .pie-chart.active path {
-          opacity: ${TREE_OPACITY.active};
-          filter: ${TREE_EFFECTS.active};
-        }
-
-        .pie-chart.hover-active path {
-          opacity: ${TREE_OPACITY.hover};
-          filter: ${TREE_EFFECTS.hover};
-        }
-
-        .pie-chart.final path {
-          filter: ${TREE_EFFECTS.final};
-        }
-
-        .pie-chart.final {
-          animation: pulse 1.5s ease-in-out infinite;
-        }
-
-        @keyframes pulse {
-          0%, 100% { transform: scale(1); }
-          50% { transform: scale(1.1); }
-        }
-
-        .node text.feature-label {
-          font-size: 12px;
-          font-weight: ${FONT_WEIGHTS.normal};
-          fill: ${TREE_COLORS.textDefault};
-          opacity: ${TREE_OPACITY.inactive};
-          transition: opacity 0.3s ease;
-        }
-
-        .node text.feature-label.active {
-          opacity: ${TREE_OPACITY.active};
-          font-weight: ${FONT_WEIGHTS.normal};
-          fill: ${TREE_COLORS.textDefault};
-        }
-
-        .node text.feature-label.hover-active {
-          opacity: ${TREE_OPACITY.hover};
-          fill: ${TREE_COLORS.hover};
-        }
-
-        /* Prediction labels - hidden by default, shown when highlighted */
-        .node text.prediction-label {
-          font-size: ${FONTS.tree.predictionLabel};
-          font-weight: ${FONT_WEIGHTS.normal};
-          fill: ${TREE_COLORS.textDefault};
-          opacity: 0;
-          transition: all 0.3s ease;
-        }
-
-        .node text.prediction-label.active,
-        .node text.prediction-label.tutorial-highlight,
-        .node text.prediction-label.path-a,
-        .node text.prediction-label.path-b,
-        .node text.prediction-label.path-shared {
-          opacity: ${TREE_OPACITY.active};
-          font-weight: ${FONT_WEIGHTS.normal};
-          font-size: ${FONTS.tree.predictionLabelHighlight};
-          fill: white;
-          transform: translateY(${TREE_SIZING.labelOffset.leafHighlight}px);
-          filter: ${TREE_EFFECTS.labelShadow};
-        }
-
-        /* Keep survival rate (third tspan) bold, not parentheses */
-        .node text.prediction-label.active tspan:nth-child(3),
-        .node text.prediction-label.tutorial-highlight tspan:nth-child(3),
-        .node text.prediction-label.path-a tspan:nth-child(3),
-        .node text.prediction-label.path-b tspan:nth-child(3),
-        .node text.prediction-label.path-shared tspan:nth-child(3) {
-          font-weight: ${FONT_WEIGHTS.predictionLabelHighlight};
-        }
-
-        .node text.prediction-label.tutorial-highlight {
-          fill: ${TREE_COLORS.tutorial};
-        }
-
-        .node text.prediction-label.path-a {
-          fill: ${TREE_COLORS.comparisonA};
-        }
-
-        .node text.prediction-label.path-b {
-          fill: ${TREE_COLORS.comparisonB};
-        }
-
-        .node text.prediction-label.path-shared {
-          fill: ${TREE_COLORS.comparisonShared};
-        }
-
-        .link {
-          fill: none;
-          stroke: ${TREE_COLORS.defaultStroke};
-          stroke-linecap: round;
-          stroke-opacity: 0.6;
-          transition: all 0.3s ease;
-        }
-
-        .link.active {
-          opacity: ${TREE_OPACITY.active};
-        }
-
-        .link.active.survived {
-          stroke: ${TREE_COLORS.survived};
-        }
-
-        .link.active.died {
-          stroke: ${TREE_COLORS.died};
-        }
-
-        .link.hover-active {
-          stroke: ${TREE_COLORS.hover};
-          opacity: 0.8;
-        }
-
-        .edge-label {
-          font-size: 11px;
-          fill: ${TREE_COLORS.textDefault};
-          font-weight: ${FONT_WEIGHTS.semibold};
-          opacity: ${TREE_OPACITY.inactive};
-          transition: all 0.3s ease;
-        }
-
-        .edge-label.active {
-          opacity: ${TREE_OPACITY.active};
-          font-weight: ${FONT_WEIGHTS.edgeLabelHighlight};
-          font-size: ${FONTS.tree.edgeLabelHighlight};
-          filter: ${TREE_EFFECTS.labelShadow};
-        }
-
-        .edge-label.hover-active {
-          opacity: ${TREE_OPACITY.hover};
-          fill: ${TREE_COLORS.hover};
-          font-size: ${FONTS.tree.edgeLabelHighlight};
-          font-weight: ${FONT_WEIGHTS.edgeLabelHighlight};
-          filter: ${TREE_EFFECTS.labelShadow};
-        }
-
-        .pie-chart.tutorial-highlight path {
-          opacity: ${TREE_OPACITY.active};
-          filter: ${TREE_EFFECTS.tutorial};
-        }
-
-        .link.tutorial-highlight {
-          stroke: ${TREE_COLORS.tutorial};
-          opacity: ${TREE_OPACITY.active};
-        }
-
-        /* RULE: Leaf value colors override tutorial highlight color */
-        .link.tutorial-highlight.survived {
-          stroke: ${TREE_COLORS.survived} !important;
-        }
-
-        .link.tutorial-highlight.died {
-          stroke: ${TREE_COLORS.died} !important;
-        }
-
-        .node text.tutorial-highlight {
-          opacity: ${TREE_OPACITY.active};
-          font-weight: ${FONT_WEIGHTS.normal};
-          fill: ${TREE_COLORS.tutorial};
-        }
-
-        .edge-label.tutorial-highlight {
-          opacity: ${TREE_OPACITY.active};
-          font-weight: ${FONT_WEIGHTS.edgeLabelHighlight};
-          fill: ${TREE_COLORS.tutorial};
-          font-size: ${FONTS.tree.edgeLabelHighlight};
-          filter: ${TREE_EFFECTS.labelShadow};
-        }
-
-        .pie-chart.path-a path {
-          opacity: ${TREE_OPACITY.active};
-          filter: ${TREE_EFFECTS.comparisonA};
-        }
-
-        .link.path-a {
-          stroke: ${TREE_COLORS.comparisonA};
-          opacity: ${TREE_OPACITY.active};
-        }
-
-        /* RULE: Leaf value colors override cohort colors */
-        .link.path-a.survived {
-          stroke: ${TREE_COLORS.survived} !important;
-        }
-
-        .link.path-a.died {
-          stroke: ${TREE_COLORS.died} !important;
-        }
-
-        .node text.path-a {
-          opacity: ${TREE_OPACITY.active};
-          font-weight: ${FONT_WEIGHTS.normal};
-          fill: ${TREE_COLORS.comparisonA};
-        }
-
-        .edge-label.path-a {
-          opacity: ${TREE_OPACITY.active};
-          font-weight: ${FONT_WEIGHTS.edgeLabelHighlight};
-          fill: ${TREE_COLORS.textDefault};
-          font-size: ${FONTS.tree.edgeLabelHighlight};
-          filter: ${TREE_EFFECTS.labelShadow};
-        }
-
-        .pie-chart.path-b path {
-          opacity: ${TREE_OPACITY.active};
-          filter: ${TREE_EFFECTS.comparisonB};
-        }
-
-        .link.path-b {
-          stroke: ${TREE_COLORS.comparisonB};
-          opacity: ${TREE_OPACITY.active};
-        }
-
-        /* RULE: Leaf value colors override cohort colors */
-        .link.path-b.survived {
-          stroke: ${TREE_COLORS.survived} !important;
-        }
-
-        .link.path-b.died {
-          stroke: ${TREE_COLORS.died} !important;
-        }
-
-        .node text.path-b {
-          opacity: ${TREE_OPACITY.active};
-          font-weight: ${FONT_WEIGHTS.normal};
-          fill: ${TREE_COLORS.comparisonB};
-        }
-
-        .edge-label.path-b {
-          opacity: ${TREE_OPACITY.active};
-          font-weight: ${FONT_WEIGHTS.edgeLabelHighlight};
-          fill: ${TREE_COLORS.textDefault};
-          font-size: ${FONTS.tree.edgeLabelHighlight};
-          filter: ${TREE_EFFECTS.labelShadow};
-        }
-
-        .pie-chart.path-shared path {
-          opacity: ${TREE_OPACITY.active};
-          filter: ${TREE_EFFECTS.comparisonShared};
-        }
-
-        .link.path-shared {
-          stroke: ${TREE_COLORS.comparisonShared} !important;
-          opacity: ${TREE_OPACITY.active} !important;
-        }
-
-        .node text.path-shared {
-          opacity: ${TREE_OPACITY.active};
-          font-weight: ${FONT_WEIGHTS.normal};
-          fill: ${TREE_COLORS.comparisonShared};
-        }
-
-        .edge-label.path-shared {
-          opacity: ${TREE_OPACITY.active};
-          font-weight: ${FONT_WEIGHTS.edgeLabelHighlight};
-          fill: ${TREE_COLORS.textDefault};
-          font-size: ${FONTS.tree.edgeLabelHighlight};
-          filter: ${TREE_EFFECTS.labelShadow};
-        }
-      `}</style>
+      <style>{TREE_STYLES}</style>
 
       <div className="mb-2 flex items-center justify-between">
         <div className="text-xs text-gray-400 hidden">
@@ -1,4 +1,4 @@
-import { useEffect, useRef, useState } from 'react'
+import { memo, useEffect, useRef, useState } from 'react'
 import * as d3 from 'd3'
 import { SHAP_COLORS } from '../../utils/visualizationStyles'
 import { UI_COLORS } from '../../utils/uiStyles'
@@ -140,4 +140,5 @@ function GlobalFeatureImportance({ data, height = 250 }) {
   )
 }
 
-export default GlobalFeatureImportance
+// Memoized so parent rerenders (chat, animations) skip the chart unless its props change
+export default memo(GlobalFeatureImportance)
@@ -1,4 +1,4 @@
-import { useEffect, useRef, useState } from 'react'
+import { memo, useEffect, useRef, useState } from 'react'
 import * as d3 from 'd3'
 import { SHAP_COLORS, TREE_COLORS } from '../../utils/visualizationStyles'
 import { UI_COLORS } from '../../utils/uiStyles'
@@ -21,7 +21,8 @@ import { UI_COLORS } from '../../utils/uiStyles'
 function SHAPWaterfall({ waterfallData, baseValue, finalPrediction, highlightFeatures = null, passengerData = null, height = 250 }) {
   const containerRef = useRef(null)
   const [containerWidth, setContainerWidth] = useState(650)
-  const tooltipIdRef = useRef(`shap-tooltip-${Math.random().toString(36).substr(2, 9)}`)
+  // This instance's tooltip (a D3 selection on document.body), created on first draw
+  const tooltipRef = useRef(null)
 
   // Convert log-odds to survival rate percentage
   const logOddsToPercent = (logOdds) => {
@@ -58,7 +59,8 @@ function SHAPWaterfall({ waterfallData, baseValue, finalPrediction, highlightFea
 
     const resizeObserver = new ResizeObserver(entries => {
       for (const entry of entries) {
-        const width = entry.contentRect.width
+        // Whole pixels only: sub-pixel jitter would otherwise rebuild the chart
+        const width = Math.floor(entry.contentRect.width)
         if (width > 0) {
           setContainerWidth(width)
         }
@@ -72,43 +74,8 @@ function SHAPWaterfall({ waterfallData, baseValue, finalPrediction, highlightFea
     }
   }, [])
 
-  useEffect(() => {
-    if (!waterfallData || waterfallData.length === 0 || !containerRef.current) return
-
-    // Clear existing content and this component's tooltip
-    d3.select(containerRef.current).selectAll("*").remove()
-    d3.select(`#${tooltipIdRef.current}`).remove()
-
-    // Normalize waterfall data to ensure proper continuity
-    // Each bar should start exactly where the previous bar ended
-    const normalizedData = []
-    for (let i = 0; i < waterfallData.length; i++) {
-      if (i === 0) {
-        // First bar (Base) - keep as is
-        normalizedData.push({ ...waterfallData[i] })
-      } else {
-        // Subsequent bars - ensure start equals previous normalized end
-        const prevEnd = normalizedData[i - 1].end
-        normalizedData.push({
-          ...waterfallData[i],
-          start: prevEnd,
-          end: prevEnd + waterfallData[i].value
-        })
-      }
-    }
-
-    // Use normalized data for rendering
-    const dataToRender = normalizedData
-
-    const margin = { top: 35, right: 110, bottom: 80, left: 60 }
-    const chartWidth = containerWidth - margin.left - margin.right
-    const chartHeight = height - margin.top - margin.bottom
-
-    const svg = d3.select(containerRef.current)
-      .append("svg")
-      .attr("width", containerWidth)
-      .attr("height", height)
-
+  // Build the persistent SVG structure: marker defs and ordered draw layers
+  const initChartLayers = (svg) => {
     // Define arrow markers for positive (up) and negative (down) changes
     const defs = svg.append("defs")
 
@@ -136,16 +103,18 @@ function SHAPWaterfall({ waterfallData, baseValue, finalPrediction, highlightFea
       .attr("d", "M 2 3 L 5 8 L 8 3 Z")
       .attr("fill", SHAP_COLORS.negative)
 
-    const g = svg.append("g")
-      .attr("transform", `translate(${margin.left},${margin.top})`)
-
-    // Use 'g' instead of 'svg' for all subsequent elements
-    const chart = g
+    // Layers keep draw order stable while bars and connectors are updated in place
+    const chart = svg.append("g").attr("class", "waterfall-chart")
+    chart.append("g").attr("class", "layer-axes")
+    chart.append("g").attr("class", "layer-connectors")
+    chart.append("g").attr("class", "layer-bars")
+    chart.append("g").attr("class", "layer-overlay")
+  }
 
-    // Create tooltip (matching decision tree styles)
-    const tooltip = d3.select("body")
+  // Create this component's tooltip (matching decision tree styles)
+  const createTooltip = () => {
+    return d3.select("body")
       .append("div")
-      .attr("id", tooltipIdRef.current)
       .attr("class", "shap-tooltip tooltip")
       .style("position", "absolute")
       .style("padding", "12px")
@@ -160,6 +129,105 @@ function SHAPWaterfall({ waterfallData, baseValue, finalPrediction, highlightFea
       .style("opacity", 0)
       .style("transition", "opacity 0.2s")
       .style("z-index", "1000")
+  }
+
+  // Remove this component's tooltip on unmount (it lives on document.body)
+  useEffect(() => {
+    return () => {
+      tooltipRef.current?.remove()
+      tooltipRef.current = null
+    }
+  }, [])
+
+  useEffect(() => {
+    if (!waterfallData || waterfallData.length === 0 || !containerRef.current) return
+
+    // Normalize waterfall data to ensure proper continuity
+    // Each bar should start exactly where the previous bar ended
+    const normalizedData = []
+    for (let i = 0; i < waterfallData.length; i++) {
+      if (i === 0) {
+        // First bar (Base) - keep as is
+        normalizedData.push({ ...waterfallData[i] })
+      } else {
+        // Subsequent bars - ensure start equals previous normalized end
+        const prevEnd = normalizedData[i - 1].end
+        normalizedData.push({
+          ...waterfallData[i],
+          start: prevEnd,
+          end: prevEnd + waterfallData[i].value
+        })
+      }
+    }
+
+    // Use normalized data for rendering
+    const dataToRender = normalizedData
+
+    const margin = { top: 35, right: 110, bottom: 80, left: 60 }
+    const chartWidth = containerWidth - margin.left - margin.right
+    const chartHeight = height - margin.top - margin.bottom
+
+    // The SVG root, its layers and the tooltip persist across updates;
+    // only the layers' contents change when the data or size changes
+    let svg = d3.select(containerRef.current).select("svg")
+    if (svg.empty()) {
+      svg = d3.select(containerRef.current).append("svg")
+      initChartLayers(svg)
+    }
+    svg
+      .attr("width", containerWidth)
+      .attr("height", height)
+
+    const chart = svg.select(".waterfall-chart")
+      .attr("transform", `translate(${margin.left},${margin.top})`)
+    const axesLayer = chart.select(".layer-axes")
+    const connectorLayer = chart.select(".layer-connectors")
+    const barLayer = chart.select(".layer-bars")
+    const overlayLayer = chart.select(".layer-overlay")
+    axesLayer.selectAll("*").remove()
+    overlayLayer.selectAll("*").remove()
+
+    if (!tooltipRef.current) {
+      tooltipRef.current = createTooltip()
+    }
+    const tooltip = tooltipRef.current
+
+    const formatTooltip = (d) => {
+      // Calculate survival rate at this cumulative value
+      const survivalRate = logOddsToPercent(d.end)
+      const impactDirection = d.value >= 0 ? "survival" : "death"
+      const impactColor = d.value >= 0 ? SHAP_COLORS.positive : SHAP_COLORS.negative
+
+      // Format tooltip content
+      let tooltipContent = `<strong>${d.feature}</strong><br/>`
+
+      // Skip detailed info for base value
+      if (d.feature !== "Base") {
+        tooltipContent += `Contribution: <span style="color: ${impactColor}; font-weight: bold;">${d.value >= 0 ? '+' : ''}${d.value.toFixed(3)}</span><br/>`
+        tooltipContent += `Direction: Pushes toward <strong>${impactDirection}</strong><br/>`
+        tooltipContent += `Cumulative SHAP: ${d.end.toFixed(3)}<br/>`
+      } else {
+        tooltipContent += `Value: ${d.start.toFixed(3)}<br/>`
+      }
+
+      tooltipContent += `<strong>Survival Rate: ${survivalRate}%</strong>`
+      return tooltipContent
+    }
+
+    // Mousemove can fire far faster than the display refreshes, so the
+    // tooltip is repositioned at most once per animation frame
+    let tooltipFrame = null
+    let lastPointer = null
+    const moveTooltip = (event) => {
+      lastPointer = { x: event.pageX, y: event.pageY }
+      if (tooltipFrame !== null) return
+      tooltipFrame = requestAnimationFrame(() => {
+        tooltipFrame = null
+        tooltip
+          .style("left", (lastPointer.x + 15) + "px")
+          .style("top", (lastPointer.y - 15) + "px")
+      })
+    }
 
     // Calculate survival percentages for labels
     const finalPercent = logOddsToPercent(finalPrediction)
@@ -170,20 +238,24 @@ function SHAPWaterfall({ waterfallData, baseValue, finalPrediction, highlightFea
       .range([0, chartWidth])
       .padding(0.3)
 
-    const allValues = dataToRender.flatMap(d => [d.start, d.end])
-    const yExtent = d3.extent(allValues)
+    // Bars run from start to end in either direction; read the extent
+    // straight off the bars instead of a flattened copy of both columns
+    const yExtent = [
+      d3.min(dataToRender, d => Math.min(d.start, d.end)),
+      d3.max(dataToRender, d => Math.max(d.start, d.end))
+    ]
     const y = d3.scaleLinear()
       .domain(yExtent)
       .range([chartHeight, 0])
       .nice()
 
     // Add Y axis
-    chart.append("g")
+    axesLayer.append("g")
       .attr("class", "axis")
       .call(d3.axisLeft(y).ticks(5))
 
     // Add Y axis label
-    chart.append("text")
+    axesLayer.append("text")
       .attr("transform", "rotate(-90)")
       .attr("x", -chartHeight / 2)
       .attr("y", -45)
@@ -193,24 +265,22 @@ function SHAPWaterfall({ waterfallData, baseValue, finalPrediction, highlightFea
       .text("Cumulative SHAP")
 
     // Draw connector lines between bars (vertical)
-    // These connect the end of one bar to the start of the next
-    for (let i = 0; i < dataToRender.length - 1; i++) {
-      const current = dataToRender[i]
-      const next = dataToRender[i + 1]
-
-      chart.append("line")
-        .attr("class", "connector-line")
-        .attr("x1", x(i) + x.bandwidth())  // Right edge of current bar
-        .attr("y1", y(current.end))        // Vertical position of current bar's end value
-        .attr("x2", x(i + 1))              // Left edge of next bar
-        .attr("y2", y(next.start))         // Vertical position of next bar's start value
-    }
+    // These connect the end of one bar to the start of the next,
+    // built in one data join over consecutive pairs
+    connectorLayer.selectAll(".connector-line")
+      .data(d3.pairs(dataToRender))
+      .join("line")
+      .attr("class", "connector-line")
+      .attr("x1", (d, i) => x(i) + x.bandwidth())  // Right edge of current bar
+      .attr("y1", ([current]) => y(current.end))   // Vertical position of current bar's end value
+      .attr("x2", (d, i) => x(i + 1))              // Left edge of next bar
+      .attr("y2", ([, next]) => y(next.start))     // Vertical position of next bar's start value
 
     // Draw floating bars (vertical)
-    chart.selectAll(".bar")
-      .data(dataToRender)
-      .enter()
-      .append("rect")
+    // Keyed join: existing bars are updated in place instead of recreated
+    barLayer.selectAll("rect")
+      .data(dataToRender, d => d.feature)
+      .join("rect")
       .attr("class", (d, i) => {
         let className = ""
         if (i === 0) {
@@ -242,37 +312,22 @@ function SHAPWaterfall({ waterfallData, baseValue, finalPrediction, highlightFea
       })
       .attr("rx", 2)
       .on("mouseover", function(event, d) {
-        // Show tooltip
-        tooltip.style("opacity", 1)
+        // Content only depends on the bar, so it is written once per hover
+        tooltip.html(formatTooltip(d))
+          .style("opacity", 1)
+        moveTooltip(event)
         // Highlight bar slightly
         d3.select(this).style("opacity", 1)
       })
-      .on("mousemove", function(event, d) {
-        // Calculate survival rate at this cumulative value
-        const survivalRate = logOddsToPercent(d.end)
-        const impactDirection = d.value >= 0 ? "survival" : "death"
-        const impactColor = d.value >= 0 ? SHAP_COLORS.positive : SHAP_COLORS.negative
-
-        // Format tooltip content
-        let tooltipContent = `<strong>${d.feature}</strong><br/>`
-
-        // Skip detailed info for base value
-        if (d.feature !== "Base") {
-          tooltipContent += `Contribution: <span style="color: ${impactColor}; font-weight: bold;">${d.value >= 0 ? '+' : ''}${d.value.toFixed(3)}</span><br/>`
-          tooltipContent += `Direction: Pushes toward <strong>${impactDirection}</strong><br/>`
-          tooltipContent += `Cumulative SHAP: ${d.end.toFixed(3)}<br/>`
-        } else {
-          tooltipContent += `Value: ${d.start.toFixed(3)}<br/>`
-        }
-
-        tooltipContent += `<strong>Survival Rate: ${survivalRate}%</strong>`
-
-        tooltip.html(tooltipContent)
-          .style("left", (event.pageX + 15) + "px")
-          .style("top", (event.pageY - 15) + "px")
+      .on("mousemove", function(event) {
+        moveTooltip(event)
       })
       .on("mouseout", function() {
         // Hide tooltip
+        if (tooltipFrame !== null) {
+          cancelAnimationFrame(tooltipFrame)
+          tooltipFrame = null
+        }
         tooltip.style("opacity", 0)
         // Reset bar opacity
         d3.select(this).style("opacity", null)
@@ -280,7 +335,7 @@ function SHAPWaterfall({ waterfallData, baseValue, finalPrediction, highlightFea
 
     // Add vertical lines to bars (skip base bar)
     // Lines extend the full height of each bar
-    chart.selectAll(".bar-line")
+    overlayLayer.selectAll(".bar-line")
       .data(dataToRender.filter((d, i) => i > 0))
       .enter()
       .append("line")
@@ -297,7 +352,7 @@ function SHAPWaterfall({ waterfallData, baseValue, finalPrediction, highlightFea
     // Add arrows to bars (skip base bar)
     // Up arrow for positive values, down arrow for negative values
     const arrowSize = 8
-    chart.selectAll(".bar-arrow")
+    overlayLayer.selectAll(".bar-arrow")
       .data(dataToRender.filter((d, i) => i > 0))
       .enter()
       .append("path")
@@ -334,7 +389,7 @@ function SHAPWaterfall({ waterfallData, baseValue, finalPrediction, highlightFea
     // Position labels inside bars when they fit, otherwise outside
     const minHeightForLabel = 18 // Minimum bar height needed to fit label inside
 
-    chart.selectAll(".value-label")
+    overlayLayer.selectAll(".value-label")
       .data(dataToRender.filter((d, i) => i > 0))
       .enter()
       .append("text")
@@ -381,7 +436,7 @@ function SHAPWaterfall({ waterfallData, baseValue, finalPrediction, highlightFea
     const finalLineY = y(finalPrediction)
 
     // Draw the final prediction line
-    chart.append("line")
+    overlayLayer.append("line")
       .attr("class", "final-prediction-line")
       .attr("x1", x(dataToRender.length - 1) + x.bandwidth())
       .attr("y1", finalLineY)
@@ -391,7 +446,7 @@ function SHAPWaterfall({ waterfallData, baseValue, finalPrediction, highlightFea
       .attr("stroke-width", 2)
 
     // Add label for SHAP value
-    chart.append("text")
+    overlayLayer.append("text")
       .attr("class", "final-prediction-label")
       .attr("x", finalLineEndX + 5)
       .attr("y", finalLineY - 5)
@@ -403,7 +458,7 @@ function SHAPWaterfall({ waterfallData, baseValue, finalPrediction, highlightFea
 
     // Add label for survival rate
     const probabilityColor = getProbabilityColor(finalPercent)
-    chart.append("text")
+    overlayLayer.append("text")
       .attr("class", "final-prediction-percent")
       .attr("x", finalLineEndX + 5)
       .attr("y", finalLineY + 10)
@@ -415,7 +470,7 @@ function SHAPWaterfall({ waterfallData, baseValue, finalPrediction, highlightFea
 
     // Add label for survived/died status
     const outcomeLabel = finalPercent >= 50 ? "Survived" : "Died"
-    chart.append("text")
+    overlayLayer.append("text")
       .attr("class", "final-prediction-outcome")
       .attr("x", finalLineEndX + 5)
       .attr("y", finalLineY + 22)
@@ -425,24 +480,17 @@ function SHAPWaterfall({ waterfallData, baseValue, finalPrediction, highlightFea
       .text(outcomeLabel)
 
     // Add X axis with feature labels (feature names only, no values)
-    chart.append("g")
+    // Labels are built once and looked up by band index in the tick formatter
+    const tickLabels = dataToRender.map((d, i) => i === 0 ? "Base" : d.feature)
+    axesLayer.append("g")
       .attr("class", "axis")
       .attr("transform", `translate(0,${chartHeight})`)
-      .call(d3.axisBottom(x).tickFormat((d, i) => {
-        const item = dataToRender[i]
-        if (i === 0) return "Base"
-        return item.feature
-      }))
+      .call(d3.axisBottom(x).tickFormat(i => tickLabels[i]))
       .selectAll("text")
       .attr("transform", "rotate(-45)")
       .style("text-anchor", "end")
       .attr("dx", "-0.5em")
       .attr("dy", "0.5em")
-
-    // Cleanup function to remove this component's tooltip on unmount
-    return () => {
-      d3.select(`#${tooltipIdRef.current}`).remove()
-    }
   }, [waterfallData, baseValue, finalPrediction, highlightFeatures, containerWidth, height])
 
   if (!waterfallData || waterfallData.length === 0) {
@@ -520,4 +568,5 @@ function SHAPWaterfall({ waterfallData, baseValue, finalPrediction, highlightFea
   )
 }
 
-export default SHAPWaterfall
+// Memoized so parent rerenders (chat, animations) skip the chart unless its props change
+export default memo(SHAPWaterfall)
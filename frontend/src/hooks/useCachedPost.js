@@ -0,0 +1,151 @@
+import { useState, useEffect, useRef } from 'react'
+
+const MAX_RETRIES = 3
+const DEBOUNCE_MS = 500
+
+/**
+ * Shared hook for debounced, cached POST requests with retry logic
+ *
+ * Backs useSHAPExplanation and useSHAPComparison. Each caller owns its cache
+ * Map, so entries stay separate per endpoint.
+ *
+ * @param {Object} options
+ * @param {string} options.url - Endpoint to POST to
+ * @param {Object|null} options.body - JSON request body (null skips fetching entirely)
+ * @param {Map} options.cache - Module-level cache shared by every instance of the calling hook
+ * @param {number} options.maxCacheSize - Cache size at which the oldest entries are evicted
+ * @param {number} options.evictCount - Number of oldest entries to evict when full
+ * @returns {Object} - { data, loading, error }
+ */
+function useCachedPost({ url, body, cache, maxCacheSize, evictCount }) {
+  const [data, setData] = useState(null)
+  const [loading, setLoading] = useState(false)
+  const [error, setError] = useState(null)
+
+  const abortControllerRef = useRef(null)
+  // Holds both the debounce timer and any pending retry, so a parameter
+  // change cancels a stale retry as well
+  const timerRef = useRef(null)
+
+  // The serialized body is both the cache key and the effect dependency, so
+  // a request reruns exactly when what would be sent changes
+  const cacheKey = body ? JSON.stringify(body) : null
+
+  useEffect(() => {
+    // Clear any pending debounce or retry timer
+    if (timerRef.current) {
+      clearTimeout(timerRef.current)
+    }
+
+    // Abort any in-flight request
+    if (abortControllerRef.current) {
+      abortControllerRef.current.abort()
+    }
+
+    // Lazy: callers pass null when the chart isn't shown, so no request is made
+    if (!body) {
+      setData(null)
+      setLoading(false)
+      return
+    }
+
+    // Cached results (e.g. when leaving comparison mode) show immediately
+    const cached = cache.get(cacheKey)
+    if (cached) {
+      setData(cached)
+      setLoading(false)
+      setError(null)
+      return
+    }
+
+    // Debounce the API call
+    timerRef.current = setTimeout(() => {
+      makeRequest(body, cacheKey)
+    }, DEBOUNCE_MS)
+
+    // Cleanup function
+    return () => {
+      if (timerRef.current) {
+        clearTimeout(timerRef.current)
+      }
+      if (abortControllerRef.current) {
+        abortControllerRef.current.abort()
+      }
+    }
+    // cacheKey is the serialized body, so body is covered; cache is a
+    // module-level Map owned by the caller and never changes identity
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [url, cacheKey])
+
+  /**
+   * Clear oldest cache entries if cache is full
+   */
+  const clearOldestCacheEntries = () => {
+    if (cache.size >= maxCacheSize) {
+      const keysToDelete = Array.from(cache.keys()).slice(0, evictCount)
+      keysToDelete.forEach(key => cache.delete(key))
+    }
+  }
+
+  /**
+   * Make API request with retry logic
+   */
+  const makeRequest = async (body, cacheKey, attemptNumber = 1) => {
+    // Create new abort controller
+    abortControllerRef.current = new AbortController()
+
+    setLoading(true)
+    setError(null)
+
+    try {
+      const response = await fetch(url, {
+        method: 'POST',
+        headers: {
+          'Content-Type': 'application/json',
+        },
+        body: JSON.stringify(body),
+        signal: abortControllerRef.current.signal
+      })
+
+      if (!response.ok) {
+        throw new Error(`HTTP error! status: ${response.status}`)
+      }
+
+      const result = await response.json()
+
+      // Cache the result
+      clearOldestCacheEntries()
+      cache.set(cacheKey, result)
+
+      setData(result)
+      setError(null)
+      setLoading(false)
+    } catch (err) {
+      // Don't touch state if request was aborted (user changed params);
+      // the request that replaced it owns the loading flag now
+      if (err.name === 'AbortError') {
+        return
+      }
+
+      // Retry logic: report the failed attempt, but loading stays true
+      // until the final attempt settles
+      if (attemptNumber < MAX_RETRIES) {
+        setError(err)
+        // Exponential backoff: 2s, 4s
+        const delay = Math.pow(2, attemptNumber) * 1000
+        timerRef.current = setTimeout(() => {
+          makeRequest(body, cacheKey, attemptNumber + 1)
+        }, delay)
+      } else {
+        // Max retries reached
+        setError(err)
+        setData(null)
+        setLoading(false)
+      }
+    }
+  }
+
+  return { data, loading, error }
+}
+
+export default useCachedPost
@@ -1,4 +1,5 @@
 import { useState, useEffect } from 'react'
+import { API_URL } from '../utils/api'
 
 /**
  * Custom hook for fetching the decision tree structure
@@ -20,10 +21,7 @@ function useFetchTree() {
   useEffect(() => {
     const fetchTree = async () => {
       try {
-        // Use VITE_API_URL if set, otherwise use current origin (for production)
-        const apiUrl = import.meta.env.VITE_API_URL || window.location.origin
-
-        const response = await fetch(`${apiUrl}/api/tree`)
+        const response = await fetch(`${API_URL}/api/tree`)
 
         if (!response.ok) {
           throw new Error(`HTTP error! status: ${response.status}`)
@@ -1,4 +1,5 @@
 import { useState, useEffect } from 'react'
+import { API_URL } from '../utils/api'
 
 /**
  * Custom hook for fetching global feature importance
@@ -20,10 +21,7 @@ function useGlobalImportance() {
   useEffect(() => {
     const fetchGlobalImportance = async () => {
       try {
-        // Use VITE_API_URL if set, otherwise use current origin (for production)
-        const apiUrl = import.meta.env.VITE_API_URL || window.location.origin
-
-        const response = await fetch(`${apiUrl}/api/explain/global-importance`)
+        const response = await fetch(`${API_URL}/api/explain/global-importance`)
 
         if (!response.ok) {
           throw new Error(`HTTP error! status: ${response.status}`)
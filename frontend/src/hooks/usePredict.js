@@ -1,4 +1,5 @@
 import { useState, useEffect, useRef } from 'react'
+import { API_URL } from '../utils/api'
 
 // In-memory cache for prediction results
 const predictionCache = new Map()
@@ -95,10 +96,7 @@ function usePredict(params) {
     setError(null)
 
     try {
-      // Use VITE_API_URL if set, otherwise use current origin (for production)
-      const apiUrl = import.meta.env.VITE_API_URL || window.location.origin
-
-      const response = await fetch(`${apiUrl}/api/predict`, {
+      const response = await fetch(`${API_URL}/api/predict`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
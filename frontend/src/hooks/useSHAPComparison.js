@@ -0,0 +1,47 @@
+import { API_URL } from '../utils/api'
+import useCachedPost from './useCachedPost'
+
+// In-memory cache for paired SHAP explanation results
+const comparisonCache = new Map()
+const MAX_CACHE_SIZE = 50
+
+/**
+ * Custom hook for fetching SHAP explanations for two cohorts in one request,
+ * with debouncing, caching, and retry logic
+ *
+ * @param {Object|null} comparison - Comparison data (null skips fetching entirely)
+ * @param {Object} comparison.cohortA - Passenger parameters for cohort A {sex, pclass, age, fare}
+ * @param {Object} comparison.cohortB - Passenger parameters for cohort B {sex, pclass, age, fare}
+ * @returns {Object} - { data, loading, error }
+ * @returns {Object|null} data - { cohort_a, cohort_b }, each with {base_value, final_prediction, shap_values, waterfall_data}
+ * @returns {boolean} loading - True when request is in progress
+ * @returns {Error|null} error - Error object if request failed
+ *
+ * @example
+ * const {data, loading, error} = useSHAPComparison({
+ *   cohortA: {sex: 0, pclass: 1, age: 30, fare: 84},
+ *   cohortB: {sex: 1, pclass: 3, age: 30, fare: 13}
+ * });
+ */
+function useSHAPComparison(comparison) {
+  const cohortA = comparison?.cohortA
+  const cohortB = comparison?.cohortB
+  const hasBoth = Boolean(cohortA && cohortB)
+
+  return useCachedPost({
+    url: `${API_URL}/api/explain/shap/compare`,
+    body: hasBoth ? { cohort_a: cohortA, cohort_b: cohortB } : null,
+    cache: comparisonCache,
+    maxCacheSize: MAX_CACHE_SIZE,
+    evictCount: 10
+  })
+}
+
+/**
+ * Clear the comparison cache (useful for testing or memory management)
+ */
+export const clearSHAPComparisonCache = () => {
+  comparisonCache.clear()
+}
+
+export default useSHAPComparison
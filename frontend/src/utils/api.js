@@ -0,0 +1,5 @@
+/**
+ * API base URL, resolved once at module load
+ * Uses VITE_API_URL if set, otherwise the current origin (for production)
+ */
+export const API_URL = import.meta.env.VITE_API_URL || window.location.origin
@@ -50,58 +50,156 @@ export const COHORT_PATTERNS = {
   }
 }
 
-/**
- * Match passenger parameters to the best cohort pattern
- */
-export function matchToCohort(sex, pclass, age, fare) {
-  // Sort cohorts by priority (highest first)
-  const sortedCohorts = Object.entries(COHORT_PATTERNS).sort(
-    (a, b) => b[1].priority - a[1].priority
-  )
+// Display labels per passenger class
+const CLASS_LABELS = { 1: '1st class', 2: '2nd class', 3: '3rd class' }
+
+// Historical average fare per passenger class
+const CLASS_AVERAGE_FARES = { 1: 84, 2: 20, 3: 13 }
+
+// matchToCohort returns these pattern objects directly instead of copying
+// them, so make the whole table read-only
+for (const cohortInfo of Object.values(COHORT_PATTERNS)) {
+  const criteria = cohortInfo.match_criteria
+  if (criteria.age_range) {
+    Object.freeze(criteria.age_range)
+  }
+  Object.freeze(criteria)
+  Object.freeze(cohortInfo)
+}
+Object.freeze(COHORT_PATTERNS)
 
-  for (const [cohortName, cohortInfo] of sortedCohorts) {
+// Cohorts in match order (highest priority first), with each entry's criteria
+// flattened once at module load so matching needs no sort or key lookups
+const SORTED_COHORTS = Object.entries(COHORT_PATTERNS)
+  .sort((a, b) => b[1].priority - a[1].priority)
+  .map(([cohortName, cohortInfo]) => {
     const criteria = cohortInfo.match_criteria
+    return Object.freeze({
+      cohortName,
+      cohortInfo,
+      sex: criteria.sex ?? null,
+      pclass: criteria.pclass ?? null,
+      minAge: criteria.age_range ? criteria.age_range[0] : -Infinity,
+      maxAge: criteria.age_range ? criteria.age_range[1] : Infinity
+    })
+  })
 
+/**
+ * Find the highest-priority cohort whose criteria match, or null
+ */
+function findCohort(sex, pclass, age) {
+  for (const cohort of SORTED_COHORTS) {
     // Check sex if specified
-    if ('sex' in criteria && criteria.sex !== sex) {
+    if (cohort.sex !== null && cohort.sex !== sex) {
       continue
     }
 
     // Check pclass if specified
-    if ('pclass' in criteria && criteria.pclass !== pclass) {
+    if (cohort.pclass !== null && cohort.pclass !== pclass) {
       continue
     }
 
-    // Check age range if specified
-    if ('age_range' in criteria) {
-      const [minAge, maxAge] = criteria.age_range
-      if (age < minAge || age > maxAge) {
-        continue
-      }
+    // Check age range (unbounded when not specified)
+    if (age < cohort.minAge || age > cohort.maxAge) {
+      continue
     }
 
     // All criteria matched!
-    return { cohortName, cohortInfo }
+    return cohort
   }
 
-  // No match found, return generic fallback
-  return {
-    cohortName: null,
-    cohortInfo: {
-      response: "Here's the analysis for this passenger profile."
-    }
+  return null
+}
+
+// The only age criterion in COHORT_PATTERNS is the child range, so age
+// matters to matching only as "in this range or not"
+const [CHILD_MIN_AGE, CHILD_MAX_AGE] = COHORT_PATTERNS.first_class_child.match_criteria.age_range
+
+const isChildAge = (age) => !(age < CHILD_MIN_AGE || age > CHILD_MAX_AGE)
+
+// Best cohort for every valid sex (0/1) and pclass (1-3), resolved once at
+// module load with findCohort: sex -> pclass -> { child, adult, ageDependent }.
+// Only 1st class depends on age, so the other combinations skip the age test
+const COHORT_TABLE = new Map()
+for (const sex of [0, 1]) {
+  const byClass = new Map()
+  for (const pclass of [1, 2, 3]) {
+    const child = findCohort(sex, pclass, CHILD_MIN_AGE)
+    const adult = findCohort(sex, pclass, CHILD_MAX_AGE + 1)
+    byClass.set(pclass, { child, adult, ageDependent: child !== adult })
+  }
+  COHORT_TABLE.set(sex, byClass)
+}
+
+// Returned when no cohort matches; built once rather than on every miss
+const FALLBACK_MATCH = Object.freeze({
+  cohortName: null,
+  cohortInfo: Object.freeze({
+    response: "Here's the analysis for this passenger profile."
+  })
+})
+
+/**
+ * Match passenger parameters to the best cohort pattern
+ */
+export function matchToCohort(sex, pclass, age, fare) {
+  const entry = COHORT_TABLE.get(sex)?.get(pclass)
+
+  let cohort
+  if (!entry) {
+    // Out-of-range inputs aren't in the table; match them directly
+    cohort = findCohort(sex, pclass, age)
+  } else if (entry.ageDependent && isChildAge(age)) {
+    cohort = entry.child
+  } else {
+    cohort = entry.adult
+  }
+
+  if (cohort) {
+    return { cohortName: cohort.cohortName, cohortInfo: cohort.cohortInfo }
   }
+
+  // No match found, return generic fallback
+  return FALLBACK_MATCH
+}
+
+/**
+ * Check whether two passenger parameter objects describe the same passenger
+ */
+export function isSamePassenger(a, b) {
+  return Boolean(a && b) &&
+    a.sex === b.sex &&
+    a.pclass === b.pclass &&
+    a.age === b.age &&
+    a.fare === b.fare
 }
 
+// Descriptions for passengers already shown (presets, chat cards, the cohort
+// header), so rerenders and repeat clicks reuse the same string
+const descriptionCache = new Map()
+const MAX_DESCRIPTION_CACHE_SIZE = 128
+
 /**
  * Format passenger parameters into human-readable description
  */
 export function formatPassengerDescription(sex, pclass, age, fare) {
+  const cacheKey = `${sex}-${pclass}-${age}-${fare}`
+  const cached = descriptionCache.get(cacheKey)
+  if (cached !== undefined) {
+    return cached
+  }
+
   const sexLabel = sex === 0 ? 'female' : 'male'
-  const classLabels = { 1: '1st class', 2: '2nd class', 3: '3rd class' }
-  const classLabel = classLabels[pclass]
+  const classLabel = CLASS_LABELS[pclass]
+  const description = `${age}-year-old ${sexLabel} in ${classLabel}, £${fare} fare`
 
-  return `${age}-year-old ${sexLabel} in ${classLabel}, £${fare} fare`
+  // Drop the oldest entry once full
+  if (descriptionCache.size >= MAX_DESCRIPTION_CACHE_SIZE) {
+    descriptionCache.delete(descriptionCache.keys().next().value)
+  }
+  descriptionCache.set(cacheKey, description)
+
+  return description
 }
 
 /**
@@ -116,8 +214,7 @@ export function generateCohortLabel(params) {
 
   // Determine primary identifiers
   const sexLabel = sex === 0 ? 'women' : 'men'
-  const classLabels = { 1: '1st class', 2: '2nd class', 3: '3rd class' }
-  const classLabel = classLabels[pclass]
+  const classLabel = CLASS_LABELS[pclass]
 
   // Age category
   let ageNote = ''
@@ -130,8 +227,7 @@ export function generateCohortLabel(params) {
   }
 
   // Fare category (if notably different from class average)
-  const classAverageFares = { 1: 84, 2: 20, 3: 13 }
-  const avgFare = classAverageFares[pclass]
+  const avgFare = CLASS_AVERAGE_FARES[pclass]
   const fareRatio = fare / avgFare
   let fareNote = ''
   if (fareRatio > 1.5) {
@@ -144,6 +240,44 @@ export function generateCohortLabel(params) {
   return `${classLabel} ${sexLabel}${ageNote}${fareNote}`.trim()
 }
 
+// Comparison patterns, compiled once at module load rather than on every
+// query. None use the g flag, so sharing them across calls is stateless
+const COMPARISON_KEYWORD_PATTERN = /\b(compar|vs|versus|against|between|difference|\band\b|\bor\b)\b/
+const COMPARISON_SPLIT_PATTERN = /\b(vs\.?|versus|against|\band\b|\bor\b)\b/i
+const LEFT_PREFIX_PATTERN = /^(compare|show me|what about|between)\s+/i
+const RIGHT_PREFIX_PATTERN = /^(and|to)\s+/i
+const WOMEN_VS_MEN_PATTERN = /\bwom[ae]n\s+(vs\.?|versus|against|and|or)\s+m[ae]n\b|\bm[ae]n\s+(vs\.?|versus|against|and|or)\s+wom[ae]n\b/i
+const CHILDREN_VS_ADULTS_PATTERN = /\b(child(ren)?|kids?)\s+(vs\.?|versus|against|and|or)\s+(adults?|elderly|seniors?)\b|\b(adults?|elderly|seniors?)\s+(vs\.?|versus|against|and|or)\s+(child(ren)?|kids?)\b/i
+const FIRST_VS_THIRD_CLASS_PATTERN = /\b(1st|first)[\s-]?class\s+(vs\.?|versus|against|and|or)\s+(3rd|third)[\s-]?class\b|\b(3rd|third)[\s-]?class\s+(vs\.?|versus|against|and|or)\s+(1st|first)[\s-]?class\b/i
+const ELDERLY_PATTERN = /elderly|seniors?/
+const KIDS_PATTERN = /kids?/
+
+// Fixed results, shared (frozen) instead of rebuilt for every query
+const NO_COMPARISON = Object.freeze({ isComparison: false })
+
+const WOMEN_VS_MEN_COMPARISON = Object.freeze({
+  isComparison: true,
+  cohortA: Object.freeze({ sex: 0, pclass: 2, age: 30, fare: 20 }),
+  cohortB: Object.freeze({ sex: 1, pclass: 2, age: 30, fare: 20 }),
+  labelA: "Women",
+  labelB: "Men",
+  description: "Comparing women vs men (2nd class, age 30)"
+})
+
+const FIRST_VS_THIRD_CLASS_COMPARISON = Object.freeze({
+  isComparison: true,
+  cohortA: Object.freeze({ sex: 0, pclass: 1, age: 30, fare: 84 }),
+  cohortB: Object.freeze({ sex: 0, pclass: 3, age: 30, fare: 13 }),
+  labelA: "1st Class",
+  labelB: "3rd Class",
+  description: "Comparing 1st class vs 3rd class (female, age 30)"
+})
+
+// Results for queries already seen (suggestion chips, repeated questions).
+// Callers only read them, so a repeat returns the same object
+const comparisonCache = new Map()
+const MAX_COMPARISON_CACHE_SIZE = 64
+
 /**
  * Detect if query is asking for a comparison between two cohorts
  * Now supports dynamic parsing: "1st class women vs 3rd class men"
@@ -151,43 +285,60 @@ export function generateCohortLabel(params) {
  */
 export function detectComparison(queryText) {
   const queryLower = queryText.toLowerCase()
+  const cached = comparisonCache.get(queryLower)
+  if (cached !== undefined) {
+    return cached
+  }
+
+  const result = detectLowercaseComparison(queryLower)
+
+  // Drop the oldest entry once full
+  if (comparisonCache.size >= MAX_COMPARISON_CACHE_SIZE) {
+    comparisonCache.delete(comparisonCache.keys().next().value)
+  }
+  comparisonCache.set(queryLower, result)
+
+  return result
+}
 
+/**
+ * detectComparison for text that is already lowercase (uncached)
+ */
+function detectLowercaseComparison(queryLower) {
   // Check for comparison keywords
-  if (!/\b(compar|vs|versus|against|between|difference|\band\b|\bor\b)\b/.test(queryLower)) {
-    return { isComparison: false }
+  if (!COMPARISON_KEYWORD_PATTERN.test(queryLower)) {
+    return NO_COMPARISON
   }
 
   // Try dynamic parsing first
-  // Split on comparison keywords: vs, versus, against, and, or
-  const splitRegex = /\b(vs\.?|versus|against|\band\b|\bor\b)\b/i
-  const match = queryText.match(splitRegex)
-
-  if (match) {
-    const parts = queryText.split(splitRegex)
-
-    if (parts.length >= 2) {
-      // Extract the two cohort descriptions (parts[0] and parts[2], skipping the keyword in parts[1])
-      let leftText = parts[0].trim()
-      let rightText = parts.slice(2).join(' ').trim() // In case there are multiple split parts
-
-      // Remove common prefixes like "compare", "show me", etc.
-      leftText = leftText.replace(/^(compare|show me|what about|between)\s+/i, '').trim()
-      rightText = rightText.replace(/^(and|to)\s+/i, '').trim()
-
-      // Parse both sides
-      const cohortA = parsePassengerQuery(leftText)
-      const cohortB = parsePassengerQuery(rightText)
-
-      // If both parsed successfully, use dynamic comparison
-      if (cohortA && cohortB) {
-        return {
-          isComparison: true,
-          cohortA: cohortA,
-          cohortB: cohortB,
-          labelA: generateCohortLabel(cohortA),
-          labelB: generateCohortLabel(cohortB),
-          description: `Comparing ${generateCohortLabel(cohortA)} vs ${generateCohortLabel(cohortB)}`
-        }
+  // Split on comparison keywords: vs, versus, against, and, or. The split
+  // keeps the keyword as parts[1], so fewer than 2 parts means no keyword
+  const parts = queryLower.split(COMPARISON_SPLIT_PATTERN)
+
+  if (parts.length >= 2) {
+    // Extract the two cohort descriptions (parts[0] and parts[2], skipping the keyword in parts[1])
+    let leftText = parts[0].trim()
+    let rightText = parts.slice(2).join(' ').trim() // In case there are multiple split parts
+
+    // Remove common prefixes like "compare", "show me", etc.
+    leftText = leftText.replace(LEFT_PREFIX_PATTERN, '').trim()
+    rightText = rightText.replace(RIGHT_PREFIX_PATTERN, '').trim()
+
+    // Parse both sides
+    const cohortA = parseLowercaseQuery(leftText)
+    const cohortB = parseLowercaseQuery(rightText)
+
+    // If both parsed successfully, use dynamic comparison
+    if (cohortA && cohortB) {
+      const labelA = generateCohortLabel(cohortA)
+      const labelB = generateCohortLabel(cohortB)
+      return {
+        isComparison: true,
+        cohortA: cohortA,
+        cohortB: cohortB,
+        labelA,
+        labelB,
+        description: `Comparing ${labelA} vs ${labelB}`
       }
     }
   }
@@ -196,86 +347,119 @@ export function detectComparison(queryText) {
   // These are kept for backwards compatibility and clearer labeling
 
   // Women vs Men (simple, no other qualifiers)
-  if (/\bwom[ae]n\s+(vs\.?|versus|against|and|or)\s+m[ae]n\b/i.test(queryLower) ||
-      /\bm[ae]n\s+(vs\.?|versus|against|and|or)\s+wom[ae]n\b/i.test(queryLower)) {
-    return {
-      isComparison: true,
-      cohortA: { sex: 0, pclass: 2, age: 30, fare: 20 },
-      cohortB: { sex: 1, pclass: 2, age: 30, fare: 20 },
-      labelA: "Women",
-      labelB: "Men",
-      description: "Comparing women vs men (2nd class, age 30)"
-    }
+  if (WOMEN_VS_MEN_PATTERN.test(queryLower)) {
+    return WOMEN_VS_MEN_COMPARISON
   }
 
   // Children vs Adults (includes kids vs elderly)
-  if (/\b(child(ren)?|kids?)\s+(vs\.?|versus|against|and|or)\s+(adults?|elderly|seniors?)\b/i.test(queryLower) ||
-      /\b(adults?|elderly|seniors?)\s+(vs\.?|versus|against|and|or)\s+(child(ren)?|kids?)\b/i.test(queryLower)) {
+  if (CHILDREN_VS_ADULTS_PATTERN.test(queryLower)) {
     // Determine if comparing to elderly specifically
-    const isElderlyComparison = /elderly|seniors?/i.test(queryLower)
+    const isElderlyComparison = ELDERLY_PATTERN.test(queryLower)
+    const isKidsQuery = KIDS_PATTERN.test(queryLower)
 
     return {
       isComparison: true,
       cohortA: { sex: 0, pclass: 2, age: 8, fare: 20 },
       cohortB: { sex: 0, pclass: 2, age: isElderlyComparison ? 65 : 35, fare: 20 },
-      labelA: /kids?/i.test(queryLower) ? "Kids" : "Children",
+      labelA: isKidsQuery ? "Kids" : "Children",
       labelB: isElderlyComparison ? "Elderly" : "Adults",
-      description: `Comparing ${/kids?/i.test(queryLower) ? "kids" : "children"} (age 8) vs ${isElderlyComparison ? "elderly (age 65)" : "adults (age 35)"}`
+      description: `Comparing ${isKidsQuery ? "kids" : "children"} (age 8) vs ${isElderlyComparison ? "elderly (age 65)" : "adults (age 35)"}`
     }
   }
 
   // 1st class vs 3rd class (simple)
-  if (/\b(1st|first)[\s-]?class\s+(vs\.?|versus|against|and|or)\s+(3rd|third)[\s-]?class\b/i.test(queryLower) ||
-      /\b(3rd|third)[\s-]?class\s+(vs\.?|versus|against|and|or)\s+(1st|first)[\s-]?class\b/i.test(queryLower)) {
-    return {
-      isComparison: true,
-      cohortA: { sex: 0, pclass: 1, age: 30, fare: 84 },
-      cohortB: { sex: 0, pclass: 3, age: 30, fare: 13 },
-      labelA: "1st Class",
-      labelB: "3rd Class",
-      description: "Comparing 1st class vs 3rd class (female, age 30)"
-    }
+  if (FIRST_VS_THIRD_CLASS_PATTERN.test(queryLower)) {
+    return FIRST_VS_THIRD_CLASS_COMPARISON
   }
 
   // No comparison pattern matched
-  return { isComparison: false }
+  return NO_COMPARISON
 }
 
+// Every sex/class/age keyword in one alternation, so a query is scanned once
+// instead of once per keyword group. The zero-width lookahead reports a match
+// at each start position, so adjacent keywords are all seen. Keywords must be
+// whole words: "man" no longer matches inside "woman" or "human", and "old"
+// inside "gold". Comparatives that substring matching used to catch are listed
+// explicitly (younger, older, richer, wealthier). The lookbehind keeps the
+// "old" of "8 year old" from reading as a senior, so the numeric age is used
+const KEYWORD_PATTERN = new RegExp(
+  '(?=\\b(?:' + [
+    '(?<female>woman|women|females?|lady|ladies|girls?)',
+    '(?<male>man|men|males?|gentlem[ae]n|boys?)',
+    '(?<firstClass>1st[\\s-]?class|first[\\s-]?class|upper[\\s-]?class|wealthy|wealthier|rich|richer)',
+    '(?<secondClass>2nd[\\s-]?class|second[\\s-]?class|middle[\\s-]?class)',
+    '(?<thirdClass>3rd[\\s-]?class|third[\\s-]?class|lower[\\s-]?class|poor|cheap)',
+    '(?<child>child|children|kids?|young|younger|bab(?:y|ies)|infants?)',
+    '(?<senior>elderly|seniors?|older|(?<!\\b(?:years?|yrs?)[\\s-]*)old)',
+    '(?<adult>adults?|middle-aged|middle aged)'
+  ].join('|') + ')\\b)',
+  'g'
+)
+
+/**
+ * Collect the keyword groups (female, firstClass, child, ...) present in a query
+ */
+function findKeywordGroups(queryLower) {
+  const found = new Set()
+  for (const match of queryLower.matchAll(KEYWORD_PATTERN)) {
+    // Alternatives are tried in order, so exactly one group is set per match
+    for (const group in match.groups) {
+      if (match.groups[group] !== undefined) {
+        found.add(group)
+        break
+      }
+    }
+  }
+  return found
+}
+
+// Numeric age in free text, e.g. "8 year old", "45 yr old" (compiled once at module load)
+const AGE_PATTERN = /\b(\d+)[\s-]*(?:year|yr|y\.o\.|old)?\b/
+
 /**
  * Parse natural language query into passenger parameters
  */
 export function parsePassengerQuery(queryText) {
-  const queryLower = queryText.toLowerCase()
+  return parseLowercaseQuery(queryText.toLowerCase())
+}
+
+/**
+ * parsePassengerQuery for text that is already lowercase, so detectComparison
+ * can parse both halves of a query it has lowercased once
+ */
+function parseLowercaseQuery(queryLower) {
+  const keywords = findKeywordGroups(queryLower)
 
   // Parse sex
   let sex = null
-  if (/woman|women|female|lady|ladies|girl/.test(queryLower)) {
+  if (keywords.has('female')) {
     sex = 0
-  } else if (/man|men|male|gentleman|boy/.test(queryLower)) {
+  } else if (keywords.has('male')) {
     sex = 1
   }
 
   // Parse class
   let pclass = null
-  if (/1st[\s-]?class|first[\s-]?class|upper[\s-]?class|wealthy|rich/.test(queryLower)) {
+  if (keywords.has('firstClass')) {
     pclass = 1
-  } else if (/2nd[\s-]?class|second[\s-]?class|middle[\s-]?class/.test(queryLower)) {
+  } else if (keywords.has('secondClass')) {
     pclass = 2
-  } else if (/3rd[\s-]?class|third[\s-]?class|lower[\s-]?class|poor|cheap/.test(queryLower)) {
+  } else if (keywords.has('thirdClass')) {
     pclass = 3
   }
 
   // Parse age (approximate)
   let age = null
-  if (/child|children|kid|young|baby|infant/.test(queryLower)) {
+  if (keywords.has('child')) {
     age = 8 // Young child
-  } else if (/elderly|senior|older|old/.test(queryLower)) {
+  } else if (keywords.has('senior')) {
     age = 65 // Senior
-  } else if (/adult|middle-aged|middle aged/.test(queryLower)) {
+  } else if (keywords.has('adult')) {
     age = 35 // Middle-aged adult
   } else {
     // Try to extract numeric age
-    const ageMatch = queryLower.match(/\b(\d+)[\s-]*(year|yr|y\.o\.|old)?\b/)
+    const ageMatch = AGE_PATTERN.exec(queryLower)
     if (ageMatch) {
       age = parseInt(ageMatch[1])
     }
@@ -286,15 +470,8 @@ export function parsePassengerQuery(queryText) {
     age = 30 // Default adult age
   }
 
-  // Set fare based on class (historical averages)
-  let fare = null
-  if (pclass === 1) {
-    fare = 84
-  } else if (pclass === 2) {
-    fare = 20
-  } else if (pclass === 3) {
-    fare = 13
-  }
+  // Set fare based on class (historical averages), 2nd class fare by default
+  const fare = CLASS_AVERAGE_FARES[pclass] ?? 20
 
   // Must have at least one identifier to be valid (sex, pclass, or age)
   // Age alone is valid for queries like "kids" or "elderly"
@@ -310,9 +487,6 @@ export function parsePassengerQuery(queryText) {
   if (pclass === null) {
     pclass = 2 // Default to 2nd class
   }
-  if (fare === null) {
-    fare = 20 // Default to 2nd class fare
-  }
 
   return { sex, pclass, age, fare }
 }
@@ -0,0 +1,72 @@
+/**
+ * Tests for keyword matching in parsePassengerQuery
+ *
+ * Run with: npm test (Node's built-in test runner, no extra dependencies)
+ *
+ * Keywords match as whole words. Cases marked "was" record how the older
+ * substring matching parsed the same query.
+ */
+import { test } from 'node:test'
+import assert from 'node:assert/strict'
+import { parsePassengerQuery } from './cohortPatterns.js'
+
+const parse = (query) => {
+  const { sex, pclass, age } = parsePassengerQuery(query)
+  return { sex, pclass, age }
+}
+
+test('suggestion chips parse as before', () => {
+  assert.deepEqual(parse('1st class male passenger'), { sex: 1, pclass: 1, age: 30 })
+  assert.deepEqual(parse('Children in 3rd class'), { sex: 0, pclass: 3, age: 8 })
+})
+
+test('plural keywords match', () => {
+  assert.equal(parse('girls in 3rd class').sex, 0)
+  assert.equal(parse('females in 3rd class').sex, 0)
+  assert.equal(parse('boys in 1st class').sex, 1)
+  assert.equal(parse('males in 1st class').sex, 1)
+  assert.equal(parse('kids in 2nd class').age, 8)
+  assert.equal(parse('infants in 3rd class').age, 8)
+  assert.equal(parse('adults in first class').age, 35)
+  assert.equal(parse('seniors in 2nd class').age, 65)
+})
+
+test('"babies" reads as child (was: no match, age 30)', () => {
+  assert.equal(parse('babies in third class').age, 8)
+})
+
+test('"gentleman" and "gentlemen" read as male', () => {
+  assert.equal(parse('a gentleman in 1st class').sex, 1)
+  assert.equal(parse('gentlemen in 3rd class').sex, 1)
+})
+
+test('"old" after year/yr keeps the numeric age (was: age 65)', () => {
+  assert.deepEqual(parse('8 year old girl in 1st class'), { sex: 0, pclass: 1, age: 8 })
+  assert.equal(parse('8-year-old girl').age, 8)
+  assert.equal(parse('a 45 yr old woman').age, 45)
+  assert.equal(parse('a 45 years old man in 3rd class').age, 45)
+})
+
+test('standalone "old" still reads as senior', () => {
+  assert.equal(parse('old man').age, 65)
+})
+
+test('keywords inside other words no longer match', () => {
+  // "man" inside "human" / "many" (was: sex 1)
+  assert.equal(parse('human in first class').sex, 0)
+  assert.equal(parse('many people in first class').sex, 0)
+  // "old" inside "gold" (was: age 65)
+  assert.equal(parse('rich gold miner woman').age, 30)
+})
+
+test('comparative forms match like their base words', () => {
+  assert.equal(parse('younger woman').age, 8)
+  assert.equal(parse('older woman').age, 65)
+  assert.equal(parse('richer woman').pclass, 1)
+  // "wealthy" is not a substring of "wealthier" (was: no match, pclass 2)
+  assert.equal(parse('wealthier man').pclass, 1)
+})
+
+test('superlative "oldest" no longer matches (was: age 65)', () => {
+  assert.equal(parse('oldest woman').age, 30)
+})
@@ -10,6 +10,12 @@ export default defineConfig({
       input: {
         main: resolve(__dirname, 'index.html'),
       },
+      output: {
+        // Keep d3 in its own long-lived chunk so app changes don't invalidate it
+        manualChunks: {
+          d3: ['d3'],
+        },
+      },
     },
   },
   server: {